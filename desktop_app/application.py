@@ -1,6 +1,5 @@
 from PyQt5.QtWidgets import QDialog, QApplication
-from PyQt5.QtCore import QSettings
-from dialogs import LoginDialog, PinDialog
+from dialogs import LoginDialog, PinDialog, SETTINGS
 
 class ZeroTraceApplication(QApplication):
     """Main application class with Supabase integration"""
@@ -46,8 +45,7 @@ class ZeroTraceApplication(QApplication):
                     return False
         else:
             # Offline mode - use local PIN
-            settings = QSettings("ZeroTrace", "Application")
-            has_local_pin = settings.value("app_pin_hash", "") or settings.value("app_pin", "")
+            has_local_pin = SETTINGS.value("app_pin_hash", "") or SETTINGS.value("app_pin", "")
             
             if has_local_pin:
                 pin_dialog = PinDialog(None, None, setup_mode=False)
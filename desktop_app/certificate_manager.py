@@ -1,8 +1,6 @@
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, Optional, Tuple, List
-from signer import CertificateSigner, generate_cert_id
-from pdf_generator import PDFCertificateGenerator
 from supabase import create_client, Client
 from dotenv import load_dotenv
 from logger import logger
@@ -32,8 +30,10 @@ class CertificateManager:
             self.supabase = supabase_client
             self.supabase_wrapper = supabase_client
         
-        self.signer = CertificateSigner()
-        self.pdf_generator = PDFCertificateGenerator()
+        # Signer (pycryptodome) and PDF generator (reportlab/qrcode) are
+        # created on first use so startup doesn't load them
+        self._signer = None
+        self._pdf_generator = None
         
         # Get current user from auth
         self.user = None
@@ -49,6 +49,22 @@ class CertificateManager:
         self.local_certs_dir = Path("certificates")
         self.local_certs_dir.mkdir(exist_ok=True)
     
+    @property
+    def signer(self):
+        """Certificate signer, created on first use"""
+        if self._signer is None:
+            from signer import CertificateSigner
+            self._signer = CertificateSigner()
+        return self._signer
+    
+    @property
+    def pdf_generator(self):
+        """PDF certificate generator, created on first use"""
+        if self._pdf_generator is None:
+            from pdf_generator import PDFCertificateGenerator
+            self._pdf_generator = PDFCertificateGenerator()
+        return self._pdf_generator
+    
     def create_certificate_data(self, wipe_result: Dict) -> Dict:
         """
         Create certificate data structure from wipe result
@@ -59,6 +75,8 @@ class CertificateManager:
         Returns:
             Certificate data dictionary
         """
+        from signer import generate_cert_id
+        
         # Generate certificate ID
         device_id = wipe_result.get('device_id', 'unknown')
         cert_id = generate_cert_id(device_id)
@@ -1,87 +1,203 @@
 from PyQt5.QtWidgets import (QDialog, QLabel, QVBoxLayout, QLineEdit, QMessageBox, 
                              QDialogButtonBox, QGroupBox, QStyle, QPushButton, QCheckBox)
 from PyQt5.QtCore import Qt, QSettings
-from PyQt5.QtGui import QFont
 from supabase import create_client, Client
 from dotenv import load_dotenv
+from logger import logger
+from ui_resources import ui_font, cached_standard_pixmap, vertical_gradient_brush, apply_window_brush
 import os
+import re
+import hmac
+import base64
+import hashlib
 import bcrypt
 
 load_dotenv()
 
-class LoginDialog(QDialog):
+SUPABASE_URL = os.getenv('SUPABASE_URL')
+SUPABASE_SERVICE_KEY = os.getenv('SUPABASE_SERVICE_KEY')
+
+# Shared application settings (registry-backed on Windows)
+SETTINGS = QSettings("ZeroTrace", "Application")
+
+EMAIL_REGEX = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
+
+# Dialog messages
+SUPABASE_UNAVAILABLE_MSG = (
+    "Supabase is not available.\n\n"
+    "Click 'Continue Offline' to use the app without cloud features."
+)
+INVALID_CREDENTIALS_MSG = (
+    "Invalid email or password.\n\n"
+    "Please check your credentials and try again."
+)
+EMAIL_NOT_VERIFIED_MSG = (
+    "Please verify your email address before logging in.\n\n"
+    "Check your inbox for the verification link."
+)
+SIGNUP_SUCCESS_MSG = (
+    "Account created successfully!\n\n"
+    "Please check your email to verify your account, then log in."
+)
+SIGNUP_FAILED_MSG = "Could not create account. Please try again."
+EMAIL_REGISTERED_MSG = (
+    "This email is already registered.\n\n"
+    "Please log in or use a different email."
+)
+OFFLINE_MODE_MSG = (
+    "Continue in offline mode?\n\n"
+    "Features not available offline:\n"
+    "• Cloud certificate storage\n"
+    "• Certificate sync\n"
+    "• Online verification\n\n"
+    "Local features will still work:\n"
+    "• Drive wiping\n"
+    "• Local certificate generation\n"
+    "• Operation logging"
+)
+
+# Dialog background gradient (applied through the palette, see ZeroTraceDialog)
+DIALOG_GRADIENT_TOP = "#2c3e50"
+DIALOG_GRADIENT_BOTTOM = "#3498db"
+
+# Dialog stylesheets (shared base + per-dialog overrides)
+DIALOG_BASE_QSS = """
+    QGroupBox {
+        background-color: rgba(255, 255, 255, 220);
+        border-radius: 10px;
+        margin-top: 1em;
+        padding: 15px;
+    }
+    QLineEdit {
+        padding: 8px;
+        border: 2px solid #3498db;
+        border-radius: 5px;
+        background-color: white;
+    }
+    QPushButton {
+        background-color: #3498db;
+        color: white;
+        border: none;
+        padding: 8px 15px;
+        border-radius: 5px;
+        min-width: 100px;
+    }
+    QPushButton:hover {
+        background-color: #2980b9;
+    }
+"""
+
+LOGIN_DIALOG_QSS = DIALOG_BASE_QSS + """
+    QLabel {
+        color: white;
+        font-size: 12px;
+    }
+    QLineEdit, QPushButton {
+        font-size: 12px;
+    }
+    QCheckBox {
+        color: white;
+        font-size: 11px;
+    }
+    QDialogButtonBox {
+        button-layout: center;
+    }
+"""
+
+SIGNUP_DIALOG_QSS = DIALOG_BASE_QSS + """
+    QLabel {
+        color: #2c3e50;
+    }
+    QLineEdit, QPushButton {
+        font-size: 12px;
+    }
+"""
+
+PIN_DIALOG_QSS = DIALOG_BASE_QSS + """
+    QLabel {
+        color: #2c3e50;
+    }
+    QLineEdit {
+        font-size: 16px;
+        text-align: center;
+    }
+"""
+
+# PIN hashing (PBKDF2-HMAC-SHA256, stored as "pbkdf2_sha256$<base64(salt + dk)>")
+PIN_HASH_PREFIX = "pbkdf2_sha256$"
+PIN_HASH_ITERATIONS = 200_000
+PIN_SALT_BYTES = 16
+BCRYPT_HASH_PREFIX = "$2"
+
+
+def hash_pin(pin: str) -> str:
+    """Hash a PIN for storage"""
+    salt = os.urandom(PIN_SALT_BYTES)
+    dk = hashlib.pbkdf2_hmac('sha256', pin.encode('utf-8'), salt, PIN_HASH_ITERATIONS)
+    return PIN_HASH_PREFIX + base64.b64encode(salt + dk).decode('ascii')
+
+
+def check_pin(pin: str, stored_hash: str) -> bool:
+    """Check a PIN against a stored PBKDF2 hash (or a legacy bcrypt hash)"""
+    if stored_hash.startswith(PIN_HASH_PREFIX):
+        raw = base64.b64decode(stored_hash[len(PIN_HASH_PREFIX):])
+        salt, stored_dk = raw[:PIN_SALT_BYTES], raw[PIN_SALT_BYTES:]
+        dk = hashlib.pbkdf2_hmac('sha256', pin.encode('utf-8'), salt, PIN_HASH_ITERATIONS)
+        return hmac.compare_digest(dk, stored_dk)
+    
+    if stored_hash.startswith(BCRYPT_HASH_PREFIX):
+        # Legacy bcrypt hash
+        return bcrypt.checkpw(pin.encode('utf-8'), stored_hash.encode('utf-8'))
+    
+    return False
+
+
+class ZeroTraceDialog(QDialog):
+    """Base dialog that reuses a single QMessageBox for its notifications"""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        background = vertical_gradient_brush(DIALOG_GRADIENT_TOP, DIALOG_GRADIENT_BOTTOM)
+        apply_window_brush(self, background)
+        self._msg = QMessageBox(self)
+        self._msg.setStandardButtons(QMessageBox.Ok)
+        apply_window_brush(self._msg, background)
+    
+    def _show(self, icon, title: str, text: str):
+        """Show a modal notification using the shared message box"""
+        self._msg.setIcon(icon)
+        self._msg.setWindowTitle(title)
+        self._msg.setText(text)
+        self._msg.exec_()
+
+
+class LoginDialog(ZeroTraceDialog):
     """Login dialog with Supabase authentication"""
     
     def __init__(self):
         super().__init__()
         self.setWindowTitle("ZeroTrace Login")
         self.setFixedSize(400, 550)
-        self.settings = QSettings("ZeroTrace", "Application")
+        self.settings = SETTINGS
         
         # Initialize Supabase client
         try:
-            supabase_url = os.getenv('SUPABASE_URL')
-            supabase_key = os.getenv('SUPABASE_KEY')
-            supabase_service_key = os.getenv('SUPABASE_SERVICE_KEY')
-            
-            if supabase_url and supabase_service_key:
-                self.supabase = create_client(supabase_url, supabase_service_key)
+            if SUPABASE_URL and SUPABASE_SERVICE_KEY:
+                self.supabase = create_client(SUPABASE_URL, SUPABASE_SERVICE_KEY)
                 self.supabase_available = True
             else:
                 self.supabase = None
                 self.supabase_available = False
-                print("Warning: Supabase credentials not found. Running in offline mode.")
+                logger.warning("Supabase credentials not found. Running in offline mode.")
         except Exception as e:
             self.supabase = None
             self.supabase_available = False
-            print(f"Warning: Supabase initialization failed: {e}")
+            logger.warning("Supabase initialization failed: %s", e)
         
         self.user = None
         self.session = None
         
-        # Set dialog style (same as before)
-        self.setStyleSheet("""
-            QDialog {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #2c3e50, stop:1 #3498db);
-            }
-            QGroupBox {
-                background-color: rgba(255, 255, 255, 220);
-                border-radius: 10px;
-                margin-top: 1em;
-                padding: 15px;
-            }
-            QLabel {
-                color: white;
-                font-size: 12px;
-            }
-            QLineEdit {
-                padding: 8px;
-                border: 2px solid #3498db;
-                border-radius: 5px;
-                background-color: white;
-                font-size: 12px;
-            }
-            QPushButton {
-                background-color: #3498db;
-                color: white;
-                border: none;
-                padding: 8px 15px;
-                border-radius: 5px;
-                min-width: 100px;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background-color: #2980b9;
-            }
-            QCheckBox {
-                color: white;
-                font-size: 11px;
-            }
-            QDialogButtonBox {
-                button-layout: center;
-            }
-        """)
+        self.setStyleSheet(LOGIN_DIALOG_QSS)
         self.setup_ui()
     
     def setup_ui(self):
@@ -91,18 +207,18 @@ class LoginDialog(QDialog):
         
         # Logo/Title section
         icon_label = QLabel()
-        icon_label.setPixmap(self.style().standardIcon(QStyle.SP_VistaShield).pixmap(64, 64))
+        icon_label.setPixmap(cached_standard_pixmap(self.style(), QStyle.SP_VistaShield, 64))
         icon_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(icon_label)
         
         title = QLabel("ZeroTrace")
         title.setAlignment(Qt.AlignCenter)
-        title.setFont(QFont("Segoe UI", 24, QFont.Bold))
+        title.setFont(ui_font(24, bold=True))
         layout.addWidget(title)
         
         subtitle = QLabel("Secure Device Wiping & Certification")
         subtitle.setAlignment(Qt.AlignCenter)
-        subtitle.setFont(QFont("Segoe UI", 12))
+        subtitle.setFont(ui_font(12))
         layout.addWidget(subtitle)
         
         # Connection status
@@ -119,28 +235,28 @@ class LoginDialog(QDialog):
         
         # Create login group box
         login_group = QGroupBox("Login Details")
-        login_group.setFont(QFont("Segoe UI", 10, QFont.Bold))
+        login_group.setFont(ui_font(10, bold=True))
         login_layout = QVBoxLayout(login_group)
         login_layout.setSpacing(10)
         
         # Email field
         email_label = QLabel("Email:")
-        email_label.setFont(QFont("Segoe UI", 10))
+        email_label.setFont(ui_font(10))
         email_label.setStyleSheet("color: #2c3e50;")
         self.email_edit = QLineEdit()
         self.email_edit.setPlaceholderText("Enter your email")
-        self.email_edit.setFont(QFont("Segoe UI", 10))
+        self.email_edit.setFont(ui_font(10))
         login_layout.addWidget(email_label)
         login_layout.addWidget(self.email_edit)
         
         # Password field
         password_label = QLabel("Password:")
-        password_label.setFont(QFont("Segoe UI", 10))
+        password_label.setFont(ui_font(10))
         password_label.setStyleSheet("color: #2c3e50;")
         self.password_edit = QLineEdit()
         self.password_edit.setPlaceholderText("Enter your password")
         self.password_edit.setEchoMode(QLineEdit.Password)
-        self.password_edit.setFont(QFont("Segoe UI", 10))
+        self.password_edit.setFont(ui_font(10))
         login_layout.addWidget(password_label)
         login_layout.addWidget(self.password_edit)
         
@@ -157,19 +273,19 @@ class LoginDialog(QDialog):
         button_box = QDialogButtonBox()
         
         login_btn = QPushButton("Login")
-        login_btn.setFont(QFont("Segoe UI", 10, QFont.Bold))
+        login_btn.setFont(ui_font(10, bold=True))
         login_btn.clicked.connect(self.authenticate)
         
         signup_btn = QPushButton("Sign Up")
-        signup_btn.setFont(QFont("Segoe UI", 10))
+        signup_btn.setFont(ui_font(10))
         signup_btn.clicked.connect(self.show_signup)
         
         offline_btn = QPushButton("Continue Offline")
-        offline_btn.setFont(QFont("Segoe UI", 10))
+        offline_btn.setFont(ui_font(10))
         offline_btn.clicked.connect(self.continue_offline)
         
         cancel_btn = QPushButton("Cancel")
-        cancel_btn.setFont(QFont("Segoe UI", 10))
+        cancel_btn.setFont(ui_font(10))
         cancel_btn.clicked.connect(self.reject)
         
         button_box.addButton(login_btn, QDialogButtonBox.AcceptRole)
@@ -196,19 +312,15 @@ class LoginDialog(QDialog):
         password = self.password_edit.text()
         
         if not email or not password:
-            QMessageBox.warning(self, "Error", "Please enter both email and password")
+            self._show(QMessageBox.Warning, "Error", "Please enter both email and password")
             return
         
-        if '@' not in email:
-            QMessageBox.warning(self, "Error", "Please enter a valid email address")
+        if not EMAIL_REGEX.fullmatch(email):
+            self._show(QMessageBox.Warning, "Error", "Please enter a valid email address")
             return
         
         if not self.supabase_available:
-            QMessageBox.warning(
-                self, 
-                "Offline Mode", 
-                "Supabase is not available.\n\nClick 'Continue Offline' to use the app without cloud features."
-            )
+            self._show(QMessageBox.Warning, "Offline Mode", SUPABASE_UNAVAILABLE_MSG)
             return
         
         try:
@@ -225,71 +337,40 @@ class LoginDialog(QDialog):
                 # IMPORTANT: Set the session on the client for RLS
                 self.supabase.auth.set_session(response.session.access_token, response.session.refresh_token)
                 
-                # Save email if remember me is checked
+                # Save email if remember me is checked (only write on change)
                 if self.remember_me.isChecked():
-                    self.settings.setValue("email", email)
-                else:
+                    if self.settings.value("email", "") != email:
+                        self.settings.setValue("email", email)
+                elif self.settings.contains("email"):
                     self.settings.remove("email")
                 
-                QMessageBox.information(
-                    self,
-                    "Login Successful",
-                    f"Welcome back, {email}!"
-                )
+                self._show(QMessageBox.Information, "Login Successful", f"Welcome back, {email}!")
                 self.accept()
             else:
-                QMessageBox.critical(
-                    self,
-                    "Authentication Failed",
-                    "Invalid email or password"
-                )
+                self._show(QMessageBox.Critical, "Authentication Failed", "Invalid email or password")
                 
         except Exception as e:
             error_msg = str(e)
             
             if "Invalid login credentials" in error_msg:
-                QMessageBox.critical(
-                    self,
-                    "Authentication Failed",
-                    "Invalid email or password.\n\nPlease check your credentials and try again."
-                )
+                self._show(QMessageBox.Critical, "Authentication Failed", INVALID_CREDENTIALS_MSG)
             elif "Email not confirmed" in error_msg:
-                QMessageBox.warning(
-                    self,
-                    "Email Not Verified",
-                    "Please verify your email address before logging in.\n\nCheck your inbox for the verification link."
-                )
+                self._show(QMessageBox.Warning, "Email Not Verified", EMAIL_NOT_VERIFIED_MSG)
             else:
-                QMessageBox.critical(
-                    self,
-                    "Login Error",
-                    f"An error occurred during login:\n\n{error_msg}"
-                )
+                self._show(QMessageBox.Critical, "Login Error", f"An error occurred during login:\n\n{error_msg}")
     
     def show_signup(self):
         """Show signup dialog"""
         signup_dialog = SignupDialog(self.supabase, self)
         if signup_dialog.exec_() == QDialog.Accepted:
-            QMessageBox.information(
-                self,
-                "Success",
-                "Account created successfully!\n\nPlease check your email to verify your account, then log in."
-            )
+            self._show(QMessageBox.Information, "Success", SIGNUP_SUCCESS_MSG)
     
     def continue_offline(self):
         """Continue in offline mode"""
         reply = QMessageBox.question(
             self,
             "Offline Mode",
-            "Continue in offline mode?\n\n"
-            "Features not available offline:\n"
-            "• Cloud certificate storage\n"
-            "• Certificate sync\n"
-            "• Online verification\n\n"
-            "Local features will still work:\n"
-            "• Drive wiping\n"
-            "• Local certificate generation\n"
-            "• Operation logging",
+            OFFLINE_MODE_MSG,
             QMessageBox.Yes | QMessageBox.No
         )
         
@@ -299,7 +380,7 @@ class LoginDialog(QDialog):
             self.accept()
 
 
-class SignupDialog(QDialog):
+class SignupDialog(ZeroTraceDialog):
     """Sign up dialog for new users"""
     
     def __init__(self, supabase_client: Client, parent=None):
@@ -308,40 +389,7 @@ class SignupDialog(QDialog):
         self.setWindowTitle("Create Account")
         self.setFixedSize(400, 500)
         
-        self.setStyleSheet("""
-            QDialog {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #2c3e50, stop:1 #3498db);
-            }
-            QGroupBox {
-                background-color: rgba(255, 255, 255, 220);
-                border-radius: 10px;
-                margin-top: 1em;
-                padding: 15px;
-            }
-            QLabel {
-                color: #2c3e50;
-            }
-            QLineEdit {
-                padding: 8px;
-                border: 2px solid #3498db;
-                border-radius: 5px;
-                background-color: white;
-                font-size: 12px;
-            }
-            QPushButton {
-                background-color: #3498db;
-                color: white;
-                border: none;
-                padding: 8px 15px;
-                border-radius: 5px;
-                min-width: 100px;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background-color: #2980b9;
-            }
-        """)
+        self.setStyleSheet(SIGNUP_DIALOG_QSS)
         
         self.setup_ui()
     
@@ -352,14 +400,14 @@ class SignupDialog(QDialog):
         
         title = QLabel("Create New Account")
         title.setAlignment(Qt.AlignCenter)
-        title.setFont(QFont("Segoe UI", 18, QFont.Bold))
+        title.setFont(ui_font(18, bold=True))
         title.setStyleSheet("color: white;")
         layout.addWidget(title)
         
         layout.addSpacing(10)
         
         form_group = QGroupBox("Account Details")
-        form_group.setFont(QFont("Segoe UI", 10, QFont.Bold))
+        form_group.setFont(ui_font(10, bold=True))
         form_layout = QVBoxLayout(form_group)
         form_layout.setSpacing(10)
         
@@ -394,8 +442,8 @@ class SignupDialog(QDialog):
         
         button_box = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
         button_box.button(QDialogButtonBox.Ok).setText("Sign Up")
-        button_box.button(QDialogButtonBox.Ok).setFont(QFont("Segoe UI", 10, QFont.Bold))
-        button_box.button(QDialogButtonBox.Cancel).setFont(QFont("Segoe UI", 10))
+        button_box.button(QDialogButtonBox.Ok).setFont(ui_font(10, bold=True))
+        button_box.button(QDialogButtonBox.Cancel).setFont(ui_font(10))
         button_box.accepted.connect(self.signup)
         button_box.rejected.connect(self.reject)
         layout.addWidget(button_box)
@@ -410,19 +458,19 @@ class SignupDialog(QDialog):
         confirm = self.confirm_edit.text()
         
         if not name:
-            QMessageBox.warning(self, "Error", "Please enter your full name")
+            self._show(QMessageBox.Warning, "Error", "Please enter your full name")
             return
         
-        if not email or '@' not in email:
-            QMessageBox.warning(self, "Error", "Please enter a valid email address")
+        if not EMAIL_REGEX.fullmatch(email):
+            self._show(QMessageBox.Warning, "Error", "Please enter a valid email address")
             return
         
         if len(password) < 6:
-            QMessageBox.warning(self, "Error", "Password must be at least 6 characters")
+            self._show(QMessageBox.Warning, "Error", "Password must be at least 6 characters")
             return
         
         if password != confirm:
-            QMessageBox.warning(self, "Error", "Passwords do not match")
+            self._show(QMessageBox.Warning, "Error", "Passwords do not match")
             return
         
         try:
@@ -442,30 +490,18 @@ class SignupDialog(QDialog):
                 # or after email verification when user first logs in
                 self.accept()
             else:
-                QMessageBox.critical(
-                    self,
-                    "Sign Up Failed",
-                    "Could not create account. Please try again."
-                )
+                self._show(QMessageBox.Critical, "Sign Up Failed", SIGNUP_FAILED_MSG)
                 
         except Exception as e:
             error_msg = str(e)
             
             if "already registered" in error_msg.lower() or "already exists" in error_msg.lower():
-                QMessageBox.warning(
-                    self,
-                    "Email Already Registered",
-                    "This email is already registered.\n\nPlease log in or use a different email."
-                )
+                self._show(QMessageBox.Warning, "Email Already Registered", EMAIL_REGISTERED_MSG)
             else:
-                QMessageBox.critical(
-                    self,
-                    "Sign Up Error",
-                    f"An error occurred during sign up:\n\n{error_msg}"
-                )
+                self._show(QMessageBox.Critical, "Sign Up Error", f"An error occurred during sign up:\n\n{error_msg}")
 
 
-class PinDialog(QDialog):
+class PinDialog(ZeroTraceDialog):
     """PIN setup/entry dialog with Supabase storage"""
     
     def __init__(self, supabase_client: Client = None, user_id: str = None, setup_mode=True):
@@ -478,40 +514,7 @@ class PinDialog(QDialog):
         self.setWindowTitle("Set Security PIN" if setup_mode else "Enter Security PIN")
         self.setFixedSize(400, 320)
         
-        self.setStyleSheet("""
-            QDialog {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #2c3e50, stop:1 #3498db);
-            }
-            QGroupBox {
-                background-color: rgba(255, 255, 255, 220);
-                border-radius: 10px;
-                margin-top: 1em;
-                padding: 15px;
-            }
-            QLabel {
-                color: #2c3e50;
-            }
-            QLineEdit {
-                padding: 8px;
-                border: 2px solid #3498db;
-                border-radius: 5px;
-                background-color: white;
-                font-size: 16px;
-                text-align: center;
-            }
-            QPushButton {
-                background-color: #3498db;
-                color: white;
-                border: none;
-                padding: 8px 15px;
-                border-radius: 5px;
-                min-width: 100px;
-            }
-            QPushButton:hover {
-                background-color: #2980b9;
-            }
-        """)
+        self.setStyleSheet(PIN_DIALOG_QSS)
         
         self.setup_ui()
     
@@ -521,15 +524,17 @@ class PinDialog(QDialog):
         layout.setContentsMargins(30, 30, 30, 30)
         
         icon_label = QLabel()
-        icon_label.setPixmap(self.style().standardIcon(
-            QStyle.SP_DialogNoButton if self.setup_mode else QStyle.SP_DialogYesButton
-        ).pixmap(48, 48))
+        icon_label.setPixmap(cached_standard_pixmap(
+            self.style(),
+            QStyle.SP_DialogNoButton if self.setup_mode else QStyle.SP_DialogYesButton,
+            48
+        ))
         icon_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(icon_label)
         
         title = QLabel("Security PIN Setup" if self.setup_mode else "Enter Security PIN")
         title.setAlignment(Qt.AlignCenter)
-        title.setFont(QFont("Segoe UI", 16, QFont.Bold))
+        title.setFont(ui_font(16, bold=True))
         title.setStyleSheet("color: white;")
         layout.addWidget(title)
         
@@ -538,7 +543,7 @@ class PinDialog(QDialog):
         
         instruction_text = "Set a 4-digit PIN to secure the application:" if self.setup_mode else "Enter your 4-digit security PIN:"
         instruction_label = QLabel(instruction_text)
-        instruction_label.setFont(QFont("Segoe UI", 10))
+        instruction_label.setFont(ui_font(10))
         instruction_label.setAlignment(Qt.AlignCenter)
         pin_layout.addWidget(instruction_label)
         
@@ -546,7 +551,7 @@ class PinDialog(QDialog):
         self.pin_edit.setEchoMode(QLineEdit.Password)
         self.pin_edit.setMaxLength(4)
         self.pin_edit.setAlignment(Qt.AlignCenter)
-        self.pin_edit.setFont(QFont("Segoe UI", 16))
+        self.pin_edit.setFont(ui_font(16))
         pin_layout.addWidget(self.pin_edit)
         
         if self.setup_mode:
@@ -554,9 +559,9 @@ class PinDialog(QDialog):
             self.confirm_pin_edit.setEchoMode(QLineEdit.Password)
             self.confirm_pin_edit.setMaxLength(4)
             self.confirm_pin_edit.setAlignment(Qt.AlignCenter)
-            self.confirm_pin_edit.setFont(QFont("Segoe UI", 16))
+            self.confirm_pin_edit.setFont(ui_font(16))
             confirm_label = QLabel("Confirm PIN:")
-            confirm_label.setFont(QFont("Segoe UI", 10))
+            confirm_label.setFont(ui_font(10))
             confirm_label.setAlignment(Qt.AlignCenter)
             pin_layout.addWidget(confirm_label)
             pin_layout.addWidget(self.confirm_pin_edit)
@@ -565,8 +570,8 @@ class PinDialog(QDialog):
         
         button_box = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
         button_box.button(QDialogButtonBox.Ok).setText("Set PIN" if self.setup_mode else "Submit")
-        button_box.button(QDialogButtonBox.Ok).setFont(QFont("Segoe UI", 10, QFont.Bold))
-        button_box.button(QDialogButtonBox.Cancel).setFont(QFont("Segoe UI", 10))
+        button_box.button(QDialogButtonBox.Ok).setFont(ui_font(10, bold=True))
+        button_box.button(QDialogButtonBox.Cancel).setFont(ui_font(10))
         button_box.accepted.connect(self.validate_pin)
         button_box.rejected.connect(self.reject)
         layout.addWidget(button_box)
@@ -579,17 +584,17 @@ class PinDialog(QDialog):
         pin = self.pin_edit.text()
         
         if len(pin) < 4:
-            QMessageBox.warning(self, "Error", "PIN must be 4 digits")
+            self._show(QMessageBox.Warning, "Error", "PIN must be 4 digits")
             return
         
         if not pin.isdigit():
-            QMessageBox.warning(self, "Error", "PIN must contain only numbers")
+            self._show(QMessageBox.Warning, "Error", "PIN must contain only numbers")
             return
         
         if self.setup_mode:
             confirm_pin = self.confirm_pin_edit.text()
             if pin != confirm_pin:
-                QMessageBox.warning(self, "Error", "PINs do not match")
+                self._show(QMessageBox.Warning, "Error", "PINs do not match")
                 return
             
             # Save PIN
@@ -616,32 +621,29 @@ class PinDialog(QDialog):
                     self.pin = pin
                     self.accept()
                 else:
-                    QMessageBox.critical(self, "Error", "Incorrect PIN")
+                    self._show(QMessageBox.Critical, "Error", "Incorrect PIN")
             else:
                 if self.verify_pin_locally(pin):
                     self.pin = pin
                     self.accept()
                 else:
-                    QMessageBox.critical(self, "Error", "Incorrect PIN")
+                    self._show(QMessageBox.Critical, "Error", "Incorrect PIN")
     
     def save_pin_to_supabase(self, pin: str) -> bool:
         """Save hashed PIN to Supabase user_profiles"""
         try:
-            pin_hash = bcrypt.hashpw(pin.encode('utf-8'), bcrypt.gensalt())
-            pin_hash_str = pin_hash.decode('utf-8')
+            pin_hash_str = hash_pin(pin)
             
-            print(f"Attempting to save PIN for user: {self.user_id}")
+            logger.debug("Attempting to save PIN for user: %s", self.user_id)
             
             # Method 1: Try direct update
             try:
-                response = self.supabase.table('user_profiles').update({
+                self.supabase.table('user_profiles').update({
                     'pin_hash': pin_hash_str
                 }).eq('id', self.user_id).execute()
                 
-                print(f"Update response: {response}")
-                
             except Exception as update_err:
-                print(f"Update failed: {update_err}")
+                logger.warning("PIN update failed: %s", update_err)
             
             # Method 2: Verify it was saved by reading it back
             try:
@@ -650,48 +652,43 @@ class PinDialog(QDialog):
                     .eq('id', self.user_id)\
                     .execute()
                 
-                print(f"Verify response: {verify.data}")
+                logger.debug("PIN verify returned %d profile row(s)", len(verify.data or []))
                 
                 if verify.data and len(verify.data) > 0:
                     saved_hash = verify.data[0].get('pin_hash')
                     if saved_hash:
                         # Verify the hash matches what we just saved
-                        if bcrypt.checkpw(pin.encode('utf-8'), saved_hash.encode('utf-8')):
-                            print(f"✓ PIN successfully saved and verified!")
+                        if saved_hash == pin_hash_str:
+                            logger.info("PIN saved and verified in Supabase")
                             return True
                         else:
-                            print(f"⚠ Hash mismatch after save")
+                            logger.warning("PIN hash mismatch after save")
                     else:
-                        print(f"⚠ pin_hash is NULL in database")
+                        logger.warning("pin_hash is NULL in database")
                 else:
-                    print(f"⚠ No profile row exists for user {self.user_id}")
+                    logger.warning("No profile row exists for user %s", self.user_id)
                     
                     # Try to create the profile row
-                    print(f"Attempting to create profile row...")
                     try:
                         create_response = self.supabase.table('user_profiles').insert({
                             'id': self.user_id,
                             'pin_hash': pin_hash_str
                         }).execute()
                         
-                        print(f"Create response: {create_response}")
-                        
                         if create_response.data:
-                            print(f"✓ Profile created with PIN!")
+                            logger.info("Profile created with PIN")
                             return True
                             
                     except Exception as create_err:
-                        print(f"Create failed: {create_err}")
+                        logger.warning("Profile create failed: %s", create_err)
                         
             except Exception as verify_err:
-                print(f"Verify failed: {verify_err}")
+                logger.warning("PIN verify after save failed: %s", verify_err)
             
             return False
             
         except Exception as e:
-            print(f"✗ PIN save completely failed: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.error("PIN save failed: %s", e, exc_info=True)
             return False
     
     def verify_pin_from_supabase(self, pin: str) -> bool:
@@ -702,44 +699,58 @@ class PinDialog(QDialog):
                 .eq('id', self.user_id)\
                 .execute()
             
-            print(f"PIN check response: {response.data}")  # Debug
-            
             if response.data and len(response.data) > 0:
                 pin_hash = response.data[0].get('pin_hash')
                 if pin_hash:
-                    stored_hash = pin_hash.encode('utf-8')
-                    result = bcrypt.checkpw(pin.encode('utf-8'), stored_hash)
-                    print(f"PIN verification result: {result}")
-                    return result
+                    if not check_pin(pin, pin_hash):
+                        return False
+                    
+                    if pin_hash.startswith(BCRYPT_HASH_PREFIX):
+                        self.upgrade_supabase_pin_hash(pin)
+                    return True
                 else:
-                    print("No pin_hash found in profile")
+                    logger.debug("No pin_hash found in profile")
             else:
-                print("No profile found for user")
+                logger.debug("No profile found for user")
             
             return False
         
         except Exception as e:
-            print(f"Failed to verify PIN from Supabase: {e}")
+            logger.error("Failed to verify PIN from Supabase: %s", e)
             return False
     
+    def upgrade_supabase_pin_hash(self, pin: str):
+        """Replace a legacy bcrypt PIN hash in Supabase with a PBKDF2 hash"""
+        try:
+            self.supabase.table('user_profiles').update({
+                'pin_hash': hash_pin(pin)
+            }).eq('id', self.user_id).execute()
+            logger.info("Upgraded legacy PIN hash in Supabase")
+        except Exception as e:
+            logger.warning("Could not upgrade legacy PIN hash: %s", e)
+    
     def save_pin_locally(self, pin: str):
         """Save PIN locally (fallback)"""
-        settings = QSettings("ZeroTrace", "Application")
-        pin_hash = bcrypt.hashpw(pin.encode('utf-8'), bcrypt.gensalt())
-        settings.setValue("app_pin_hash", pin_hash.decode('utf-8'))
-        print("PIN saved locally")
+        SETTINGS.setValue("app_pin_hash", hash_pin(pin))
+        logger.info("PIN saved locally")
     
     def verify_pin_locally(self, pin: str) -> bool:
         """Verify PIN against local storage (fallback)"""
-        settings = QSettings("ZeroTrace", "Application")
-        stored_hash = settings.value("app_pin_hash", "")
+        stored_hash = SETTINGS.value("app_pin_hash", "")
         
-        if stored_hash:
+        # Only hash-check values that look like a PIN hash; anything else falls
+        # through to the legacy plain PIN without raising inside bcrypt
+        if stored_hash.startswith((PIN_HASH_PREFIX, BCRYPT_HASH_PREFIX)):
             try:
-                return bcrypt.checkpw(pin.encode('utf-8'), stored_hash.encode('utf-8'))
-            except:
-                old_pin = settings.value("app_pin", "")
-                return pin == old_pin
+                verified = check_pin(pin, stored_hash)
+            except ValueError:
+                verified = None
+            
+            if verified is not None:
+                if verified and stored_hash.startswith(BCRYPT_HASH_PREFIX):
+                    # Upgrade legacy bcrypt hash so later logins skip bcrypt
+                    SETTINGS.setValue("app_pin_hash", hash_pin(pin))
+                return verified
         
-        old_pin = settings.value("app_pin", "")
+        old_pin = SETTINGS.value("app_pin", "")
         return pin == old_pin
\ No newline at end of file
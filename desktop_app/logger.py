@@ -1,12 +1,34 @@
+import atexit
+import os
+import sys
+import queue
 import logging
 from pathlib import Path
-from logging.handlers import RotatingFileHandler
+from logging.handlers import RotatingFileHandler, MemoryHandler, QueueHandler, QueueListener
+
+# Log location (logs directory within desktop_app)
+LOG_DIR = Path(__file__).parent / 'logs'
+LOG_FILE = LOG_DIR / 'app.log'
+
+# Logger level: ZEROTRACE_LOG_LEVEL (e.g. "WARNING") overrides the default,
+# which is INFO for packaged (frozen) builds and DEBUG when run from source
+LOG_LEVEL_ENV = 'ZEROTRACE_LOG_LEVEL'
+DEFAULT_LOG_LEVEL = logging.INFO if getattr(sys, 'frozen', False) else logging.DEBUG
+
+
+def _configured_level() -> int:
+    """Get the logger level from the environment, falling back to the default"""
+    level = logging.getLevelName(os.environ.get(LOG_LEVEL_ENV, '').strip().upper())
+    return level if isinstance(level, int) else DEFAULT_LOG_LEVEL
 
 class ZeroTraceLogger:
     """Singleton logger for the application"""
 
     _instance = None
 
+    # Minimum progress change (in %) between wipe progress records
+    PROGRESS_LOG_STEP = 1
+
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
@@ -14,16 +36,18 @@ class ZeroTraceLogger:
         return cls._instance
 
     def _init_logger(self):
-        # Create logs directory within desktop_app
-        log_dir = Path(__file__).parent / 'logs'
-        log_dir.mkdir(parents=True, exist_ok=True)
+        # Last logged wipe progress per device
+        self._last_progress = {}
 
-        # Log file path
-        log_file = log_dir / 'app.log'
+        # Create logs directory
+        try:
+            LOG_DIR.mkdir()
+        except FileExistsError:
+            pass
 
         # Create logger
         self.logger = logging.getLogger('ZeroTrace')
-        self.logger.setLevel(logging.DEBUG)
+        self.logger.setLevel(_configured_level())
 
         # Prevent duplicate handlers
         if self.logger.handlers:
@@ -31,7 +55,7 @@ class ZeroTraceLogger:
 
         # File handler with rotation (10MB max, keep 5 backups)
         file_handler = RotatingFileHandler(
-            log_file,
+            LOG_FILE,
             maxBytes=10 * 1024 * 1024,  # 10MB
             backupCount=5,
             encoding='utf-8'
@@ -51,61 +75,84 @@ class ZeroTraceLogger:
         file_handler.setFormatter(formatter)
         console_handler.setFormatter(formatter)
 
-        self.logger.addHandler(file_handler)
-        self.logger.addHandler(console_handler)
+        # Buffer file writes; ERROR and above flush immediately
+        buffered_file_handler = MemoryHandler(
+            capacity=256,
+            flushLevel=logging.ERROR,
+            target=file_handler
+        )
+        buffered_file_handler.setLevel(logging.DEBUG)
+
+        # Write records from a background thread so callers never block on I/O
+        log_queue = queue.Queue(-1)
+        self.logger.addHandler(QueueHandler(log_queue))
+        self._listener = QueueListener(
+            log_queue, buffered_file_handler, console_handler, respect_handler_level=True
+        )
+        self._listener.start()
+        # atexit runs in reverse order: drain the queue, then flush the buffer
+        atexit.register(buffered_file_handler.close)
+        atexit.register(self._listener.stop)
 
-        self.info(f"Logger initialized. Log file: {log_file}")
+        self.info("Logger initialized. Log file: %s", LOG_FILE)
     
-    def debug(self, message: str):
-        """Log debug message"""
-        self.logger.debug(message)
+    def debug(self, message: str, *args):
+        """Log debug message (args are formatted lazily, %-style)"""
+        self.logger.debug(message, *args)
     
-    def info(self, message: str):
-        """Log info message"""
-        self.logger.info(message)
+    def info(self, message: str, *args):
+        """Log info message (args are formatted lazily, %-style)"""
+        self.logger.info(message, *args)
     
-    def warning(self, message: str):
-        """Log warning message"""
-        self.logger.warning(message)
+    def warning(self, message: str, *args):
+        """Log warning message (args are formatted lazily, %-style)"""
+        self.logger.warning(message, *args)
     
-    def error(self, message: str, exc_info=False):
-        """Log error message"""
-        self.logger.error(message, exc_info=exc_info)
+    def error(self, message: str, *args, exc_info=False):
+        """Log error message (args are formatted lazily, %-style)"""
+        self.logger.error(message, *args, exc_info=exc_info)
     
-    def critical(self, message: str, exc_info=False):
-        """Log critical message"""
-        self.logger.critical(message, exc_info=exc_info)
+    def critical(self, message: str, *args, exc_info=False):
+        """Log critical message (args are formatted lazily, %-style)"""
+        self.logger.critical(message, *args, exc_info=exc_info)
     
     def log_wipe_start(self, device: str, method: str):
         """Log wipe operation start"""
-        self.info(f"Wipe operation started - Device: {device}, Method: {method}")
+        self.logger.info("Wipe operation started - Device: %s, Method: %s", device, method)
     
     def log_wipe_progress(self, device: str, progress: int):
-        """Log wipe progress"""
-        self.debug(f"Wipe progress - Device: {device}, Progress: {progress}%")
+        """Log wipe progress (only when it moved by at least PROGRESS_LOG_STEP)"""
+        last = self._last_progress.get(device)
+        if last is not None and 0 <= progress - last < self.PROGRESS_LOG_STEP:
+            return
+        self._last_progress[device] = progress
+        
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Wipe progress - Device: %s, Progress: %d%%", device, progress)
     
     def log_wipe_complete(self, device: str, status: str, duration: str):
         """Log wipe operation completion"""
-        self.info(f"Wipe operation completed - Device: {device}, Status: {status}, Duration: {duration}")
+        self.logger.info("Wipe operation completed - Device: %s, Status: %s, Duration: %s",
+                         device, status, duration)
     
     def log_certificate_generated(self, cert_id: str, device: str):
         """Log certificate generation"""
-        self.info(f"Certificate generated - ID: {cert_id}, Device: {device}")
+        self.logger.info("Certificate generated - ID: %s, Device: %s", cert_id, device)
     
     def log_certificate_uploaded(self, cert_id: str):
         """Log certificate upload"""
-        self.info(f"Certificate uploaded to Supabase - ID: {cert_id}")
+        self.logger.info("Certificate uploaded to Supabase - ID: %s", cert_id)
     
     def log_auth_event(self, event: str, user_email: str = None):
         """Log authentication event"""
         if user_email:
-            self.info(f"Auth event: {event} - User: {user_email}")
+            self.logger.info("Auth event: %s - User: %s", event, user_email)
         else:
-            self.info(f"Auth event: {event}")
+            self.logger.info("Auth event: %s", event)
     
     def log_error_with_context(self, operation: str, error: Exception):
         """Log error with full context"""
-        self.error(f"Error during {operation}: {str(error)}", exc_info=True)
+        self.logger.error("Error during %s: %s", operation, error, exc_info=True)
 
 # Global logger instance
 logger = ZeroTraceLogger()
\ No newline at end of file
@@ -1,8 +1,11 @@
 #!/usr/bin/env python3
-import sys, ctypes
+import os, sys, ctypes, subprocess
 from pathlib import Path
 from application import ZeroTraceApplication
 
+# Working directories created at startup (the signer creates its own keys/)
+REQUIRED_DIRS = (Path("certificates"),)
+
 def ensure_admin():
     try:
         is_admin = ctypes.windll.shell32.IsUserAnAdmin()
@@ -10,22 +13,28 @@ def ensure_admin():
         is_admin = False
 
     if not is_admin:
-        # Relaunch with admin rights
+        # Relaunch with admin rights (a frozen exe is sys.executable itself,
+        # otherwise the script path must be passed to the interpreter)
+        args = sys.argv[1:] if getattr(sys, 'frozen', False) else sys.argv
         ctypes.windll.shell32.ShellExecuteW(
-            None, "runas", sys.executable, " ".join(sys.argv), None, 1
+            None, "runas", sys.executable, subprocess.list2cmdline(args), None, 1
         )
         sys.exit(0)
 
-ensure_admin()
-
 def main():
     """Main entry point"""
     # Create required directories
-    Path("certificates").mkdir(exist_ok=True)
+    for directory in REQUIRED_DIRS:
+        try:
+            directory.mkdir()
+        except FileExistsError:
+            pass
     
     # Create and run application
     app = ZeroTraceApplication(sys.argv)
     return app.run()
 
 if __name__ == "__main__":
+    if os.name == 'nt':
+        ensure_admin()
     sys.exit(main())
\ No newline at end of file
@@ -1,473 +1,170 @@
-from PyQt5.QtWidgets import (QMainWindow, QPushButton, QLabel, QVBoxLayout, QHBoxLayout, 
+from PyQt5.QtWidgets import (QApplication, QMainWindow, QPushButton, QLabel, QVBoxLayout, QHBoxLayout, 
                              QMessageBox, QProgressBar, QWidget, QComboBox, QGroupBox, 
-                             QStyle, QTextEdit, QFrame)
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QFont, QTextCursor
-from PyQt5.QtWidgets import QApplication
-from wipe_engine import WipeEngine, WipeMethod, DriveType
-from wipe_thread import WipeThread
-from certificate_manager import CertificateManager
+                             QStyle, QPlainTextEdit, QFrame)
+from PyQt5.QtCore import Qt, QTimer, QElapsedTimer
+from PyQt5.QtGui import QTextCursor, QStandardItem
 from pathlib import Path
+import sys
+
+# Make the repository root importable before any first-party imports
+_REPO_ROOT = str(Path(__file__).parent.parent)
+if _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)
+
+from wipe_engine import WipeEngine, WipeMethod, DriveType
+from wipe_thread import WipeThread, DriveScanThread, CertificateThread, progress_phase
 from logger import logger
+from ui_resources import (ui_font, mono_font, cached_standard_icon, cached_standard_pixmap,
+                          combined_theme_stylesheet, unscoped_theme_stylesheet, THEMES)
 from datetime import datetime
-from typing import Dict
-import sys
+from typing import Dict, List, Tuple
+from collections import deque
 import os
+import time
+import hashlib
+import subprocess
 
-app_font = QFont("Segoe UI", 10)
+app_font = ui_font(10)
 QApplication.setFont(app_font)
 
-sys.path.append(str(Path(__file__).parent.parent))
-
-# Define stylesheets
-DARK_STYLESHEET = """
-    /* ================================
-    ZeroTrace – Dark Pro Theme
-    Modern Cybersecurity UI Style
-    ================================ */
-
-    /* ----------- Window Background ----------- */
-    QMainWindow {
-        background-color: #0D1117;
-    }
-
-    /* ----------- GroupBox (Cards) ----------- */
-    QGroupBox {
-        background-color: #161B22;
-        border: 1px solid #21262D;
-        border-radius: 12px;
-        margin-top: 20px;
-        padding: 18px;
-        font-family: "Segoe UI";
-    }
-
-    QGroupBox::title {
-        color: #C9D1D9;
-        subcontrol-origin: margin;
-        left: 12px;
-        padding: 4px 8px;
-        font-size: 14px;
-        background: transparent;
-    }
-
-    /* ----------- Labels ----------- */
-    QLabel {
-        color: #C9D1D9;
-        font-family: "Segoe UI";
-        font-size: 11pt;
-    }
-
-    /* Subtle warnings */
-    QLabel#warningLabel {
-        color: #F85149;
-        font-weight: bold;
-    }
-
-    /* ----------- ComboBox ----------- */
-    QComboBox {
-        background-color: #0D1117;
-        border: 1px solid #30363D;
-        padding: 8px;
-        border-radius: 6px;
-        color: #C9D1D9;
-        font-size: 10pt;
-    }
-
-    QComboBox:hover {
-        border-color: #58A6FF;
-    }
-
-    /* Dropdown menu */
-    QComboBox QAbstractItemView {
-        background-color: #161B22;
-        color: #C9D1D9;
-        selection-background-color: #238636;
-        border: 1px solid #30363D;
-    }
-
-    /* ----------- Buttons (General) ----------- */
-    QPushButton {
-        background-color: #21262D;
-        color: #C9D1D9;
-        border: 1px solid #30363D;
-        padding: 10px 16px;
-        border-radius: 8px;
-        min-width: 110px;
-        font-family: "Segoe UI";
-        font-size: 11pt;
-    }
-
-    QPushButton:hover {
-        border-color: #58A6FF;
-        background-color: #30363D;
-    }
-
-    QPushButton:disabled {
-        background-color: #151A1E;
-        color: #6E7681;
-        border: 1px solid #1C2128;
-    }
-
-    /* ----------- Primary Buttons ----------- */
-    #startButton {
-        background-color: #238636;
-        border: 1px solid #2EA043;
-        color: white;
-    }
-
-    #startButton:hover {
-        background-color: #2EA043;
-    }
-
-    #stopButton {
-        background-color: #DA3633;
-        border: 1px solid #F85149;
-        color: white;
-    }
-
-    #stopButton:hover {
-        background-color: #F85149;
-    }
-
-    /* Logout / Cloud buttons */
-    #logoutButton {
-        background-color: #7435c9;
-        border: 1px solid #8e53eb;
-        color: white;
-    }
-
-    #logoutButton:hover {
-        background-color: #8e53eb;
-    }
-
-    /* ----------- Progress Bar ----------- */
-    QProgressBar {
-        background-color: #0D1117;
-        border: 1px solid #30363D;
-        border-radius: 6px;
-        height: 26px;
-        color: #C9D1D9;
-        text-align: center;
-        font-weight: bold;
-    }
-
-    QProgressBar::chunk {
-        background-color: #00FF99;
-        border-radius: 6px;
-    }
-
-    /* ----------- TextEdit (Operation Log Console) ----------- */
-    QTextEdit {
-        background-color: #0D1117;
-        color: #00EA6A;
-        border: 1px solid #30363D;
-        border-radius: 8px;
-        padding: 8px;
-        font-family: Consolas, monospace;
-        font-size: 10pt;
-    }
-
-    /* ----------- Scrollbars (Modern Minimal) ----------- */
-    QScrollBar:vertical {
-        background: #0D1117;
-        width: 12px;
-        margin: 0px;
-    }
-
-    QScrollBar::handle:vertical {
-        background: #30363D;
-        border-radius: 6px;
-    }
-
-    QScrollBar::handle:vertical:hover {
-        background: #58A6FF;
-    }
-
-    QScrollBar::add-line,
-    QScrollBar::sub-line {
-        height: 0px;
-    }
-
-    /* Horizontal scrollbars */
-    QScrollBar:horizontal {
-        background: #0D1117;
-        height: 12px;
-    }
-
-    QScrollBar::handle:horizontal {
-        background: #30363D;
-        border-radius: 6px;
-    }
-
-    QScrollBar::handle:horizontal:hover {
-        background: #58A6FF;
-    }
-
-    /* ----------- Tooltips ----------- */
-    QToolTip {
-        background-color: #161B22;
-        color: #C9D1D9;
-        border: 1px solid #30363D;
-        padding: 6px;
-        font-size: 10pt;
-    }
-
-    #HeaderContainer {
-        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                stop:0 #0E1621, stop:1 #0A0F14);
-        padding: 25px;
-        border-bottom: 1px solid #1F2937;
-    }
-
-    #TitleLabel {
-        color: #E6EDF3;
-        font-size: 26px;
-        font-weight: 700;
-        letter-spacing: 1px;
-    }
-
-    #SubtitleLabel {
-        color: #9BAEC8;
-        font-size: 14px;
-    }
-
-    #LoggedInLabel {
-        color: #00FF99;
-        font-size: 13px;
-        font-weight: bold;
-    }
-
-    #FooterBar {
-        background-color: #161B22;
-        border-top: 1px solid #21262D;
-        padding: 15px 20px;
-    }
-"""
+# Operation log batching
+LOG_FLUSH_INTERVAL_MS = 100
+LOG_MAX_BLOCKS = 500
+
+# Progress bar / status label coalescing
+PROGRESS_APPLY_INTERVAL_MS = 100
+
+# Window drag: at most one move() per frame (~60Hz)
+DRAG_MOVE_INTERVAL_MS = 16
+
+# Operation log banner
+LOG_SEPARATOR = "=" * 50
+
+# Membership sets for method selection warnings
+SSD_DRIVE_TYPES = frozenset({DriveType.SATA_SSD, DriveType.NVME_SSD})
+MULTIPASS_METHODS = frozenset({WipeMethod.DOD_3_PASS, WipeMethod.DOD_7_PASS, WipeMethod.GUTMANN_35_PASS})
+ATA_ERASE_METHODS = frozenset({WipeMethod.ATA_SECURE_ERASE, WipeMethod.ATA_ENHANCED_SECURE_ERASE})
+
+# Method selection warnings: (predicate(device, method), message)
+METHOD_WARNING_RULES = (
+    (lambda dev, method: dev.drive_type in SSD_DRIVE_TYPES and method in MULTIPASS_METHODS,
+     "⚠️ Multi-pass overwrite is not recommended for SSDs and may reduce lifespan."),
+    (lambda dev, method: dev.is_frozen and method in ATA_ERASE_METHODS,
+     "⚠️ Drive is frozen. ATA Secure Erase will fail. Power cycle the drive first."),
+    (lambda dev, method: method == WipeMethod.ATA_SECURE_ERASE and not dev.supports_ata_secure_erase,
+     "⚠️ This drive does not support ATA Secure Erase."),
+    (lambda dev, method: method == WipeMethod.NVME_FORMAT and not dev.supports_nvme_format,
+     "⚠️ This drive does not support NVMe Format."),
+)
+
+# Open a file or folder with the desktop's default application
+# (the platform is resolved once; launching does not wait for the viewer)
+def _spawn_detached(args):
+    """Start a helper process in its own session, detached from our stdio"""
+    return subprocess.Popen(
+        args,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True
+    )
+
+if sys.platform == 'win32':
+    def open_with_system_viewer(path):
+        os.startfile(os.fspath(path))
+elif sys.platform == 'darwin':  # macOS
+    def open_with_system_viewer(path):
+        return _spawn_detached(['open', os.fspath(path)])
+else:  # Linux
+    def open_with_system_viewer(path):
+        return _spawn_detached(['xdg-open', os.fspath(path)])
+
+# Delay before checking whether a spawned file opener has already failed
+OPENER_CHECK_DELAY_MS = 1500
+
+# Certificate files shown by "View Certificates"
+CERT_FILE_SUFFIXES = ('.json', '.txt')
+
+
+def has_certificate_files(cert_dir) -> bool:
+    """Whether the directory holds at least one certificate file (stops at the first)"""
+    with os.scandir(cert_dir) as entries:
+        return any(entry.name.endswith(CERT_FILE_SUFFIXES) and entry.is_file(follow_symlinks=False)
+                   for entry in entries)
+
+# Fallback text certificate (used when the certificate manager is unavailable)
+CERT_SEPARATOR = "=" * 60
+
+SIMPLE_CERT_TEMPLATE = """
+ZEROTRACE WIPE CERTIFICATE
+{separator}
+
+Certificate ID: {cert_id}
+Generated: {generated}
 
-LIGHT_STYLESHEET = """
-    /* ================================
-    ZeroTrace – Light Theme
-    Clean and Professional UI Style
-    ================================ */
-
-    /* ----------- Window Background ----------- */
-    QMainWindow {
-        background-color: #F8F9FA;
-    }
-
-    /* ----------- GroupBox (Cards) ----------- */
-    QGroupBox {
-        background-color: #FFFFFF;
-        border: 1px solid #E1E5E9;
-        border-radius: 12px;
-        margin-top: 20px;
-        padding: 18px;
-        font-family: "Segoe UI";
-    }
-
-    QGroupBox::title {
-        color: #24292F;
-        subcontrol-origin: margin;
-        left: 12px;
-        padding: 4px 8px;
-        font-size: 14px;
-        background: transparent;
-    }
-
-    /* ----------- Labels ----------- */
-    QLabel {
-        color: #24292F;
-        font-family: "Segoe UI";
-        font-size: 11pt;
-    }
-
-    /* Subtle warnings */
-    QLabel#warningLabel {
-        color: #CF222E;
-        font-weight: bold;
-    }
-
-    /* ----------- ComboBox ----------- */
-    QComboBox {
-        background-color: #FFFFFF;
-        border: 1px solid #D1D9E0;
-        padding: 8px;
-        border-radius: 6px;
-        color: #24292F;
-        font-size: 10pt;
-    }
-
-    QComboBox:hover {
-        border-color: #0969DA;
-    }
-
-    /* Dropdown menu */
-    QComboBox QAbstractItemView {
-        background-color: #FFFFFF;
-        color: #24292F;
-        selection-background-color: #238636;
-        border: 1px solid #D1D9E0;
-    }
-
-    /* ----------- Buttons (General) ----------- */
-    QPushButton {
-        background-color: #F6F8FA;
-        color: #24292F;
-        border: 1px solid #D1D9E0;
-        padding: 10px 16px;
-        border-radius: 8px;
-        min-width: 110px;
-        font-family: "Segoe UI";
-        font-size: 11pt;
-    }
-
-    QPushButton:hover {
-        border-color: #0969DA;
-        background-color: #F3F4F6;
-    }
-
-    QPushButton:disabled {
-        background-color: #FAFBFC;
-        color: #8C959F;
-        border: 1px solid #D1D9E0;
-    }
-
-    /* ----------- Primary Buttons ----------- */
-    #startButton {
-        background-color: #238636;
-        border: 1px solid #2EA043;
-        color: white;
-    }
-
-    #startButton:hover {
-        background-color: #2EA043;
-    }
-
-    #stopButton {
-        background-color: #DA3633;
-        border: 1px solid #F85149;
-        color: white;
-    }
-
-    #stopButton:hover {
-        background-color: #F85149;
-    }
-
-    /* Logout / Cloud buttons */
-    #logoutButton {
-        background-color: #8250DF;
-        border: 1px solid #8957E5;
-        color: white;
-    }
-
-    #logoutButton:hover {
-        background-color: #8957E5;
-    }
-
-    /* ----------- Progress Bar ----------- */
-    QProgressBar {
-        background-color: #FFFFFF;
-        border: 1px solid #D1D9E0;
-        border-radius: 6px;
-        height: 26px;
-        color: #24292F;
-        text-align: center;
-        font-weight: bold;
-    }
-
-    QProgressBar::chunk {
-        background-color: #238636;
-        border-radius: 6px;
-    }
-
-    /* ----------- TextEdit (Operation Log Console) ----------- */
-    QTextEdit {
-        background-color: #FFFFFF;
-        color: #24292F;
-        border: 1px solid #D1D9E0;
-        border-radius: 8px;
-        padding: 8px;
-        font-family: Consolas, monospace;
-        font-size: 10pt;
-    }
-
-    /* ----------- Scrollbars (Modern Minimal) ----------- */
-    QScrollBar:vertical {
-        background: #F8F9FA;
-        width: 12px;
-        margin: 0px;
-    }
-
-    QScrollBar::handle:vertical {
-        background: #D1D9E0;
-        border-radius: 6px;
-    }
-
-    QScrollBar::handle:vertical:hover {
-        background: #0969DA;
-    }
-
-    QScrollBar::add-line,
-    QScrollBar::sub-line {
-        height: 0px;
-    }
-
-    /* Horizontal scrollbars */
-    QScrollBar:horizontal {
-        background: #F8F9FA;
-        height: 12px;
-    }
-
-    QScrollBar::handle:horizontal {
-        background: #D1D9E0;
-        border-radius: 6px;
-    }
-
-    QScrollBar::handle:horizontal:hover {
-        background: #0969DA;
-    }
-
-    /* ----------- Tooltips ----------- */
-    QToolTip {
-        background-color: #FFFFFF;
-        color: #24292F;
-        border: 1px solid #D1D9E0;
-        padding: 6px;
-        font-size: 10pt;
-    }
-
-    #HeaderContainer {
-        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                stop:0 #FFFFFF, stop:1 #F8F9FA);
-        padding: 25px;
-        border-bottom: 1px solid #E1E5E9;
-    }
-
-    #TitleLabel {
-        color: #24292F;
-        font-size: 26px;
-        font-weight: 700;
-        letter-spacing: 1px;
-    }
-
-    #SubtitleLabel {
-        color: #656D76;
-        font-size: 14px;
-    }
-
-    #LoggedInLabel {
-        color: #238636;
-        font-size: 13px;
-        font-weight: bold;
-    }
-
-    #FooterBar {
-        background-color: #FFFFFF;
-        border-top: 1px solid #E1E5E9;
-        padding: 15px 20px;
-    }
+DEVICE INFORMATION:
+- Device: {device_name}
+- Model: {device_model}
+- Serial: {device_serial}
+- Size: {device_gb:.2f} GB
+- Type: {device_type}
+
+WIPE DETAILS:
+- Method: {method}
+- Status: {status}
+- Passes: {passes}
+- Duration: {duration}
+- Start: {start_time}
+- End: {end_time}
+
+VERIFICATION:
+- Hash: {completion_hash}
+
+{separator}
+This certificate verifies that the above device was securely
+wiped using ZeroTrace secure wipe application.
 """
 
+# Wipe-complete dialog details (informative text)
+CERT_DETAILS_TEMPLATE = (
+    "\n<b>Wipe Details:</b>\n"
+    "• Method: {method}\n"
+    "• Duration: {duration}\n"
+    "• Passes: {passes}\n"
+    "• Status: {status}\n\n"
+    "<b>Certificate Generated:</b>\n"
+    "• Certificate ID: {cert_id}\n"
+    "• Status: {upload_status}\n\n"
+    "<b>Files Saved:</b>\n"
+    "• JSON: {json_name}\n"
+    "• PDF: {pdf_name}\n\n"
+    "<b>Location:</b>\n"
+    "{location}\n"
+)
+
+SIMPLE_CERT_DETAILS_TEMPLATE = (
+    "\n<b>Wipe Details:</b>\n"
+    "• Method: {method}\n"
+    "• Duration: {duration}\n"
+    "• Status: {status}\n\n"
+    "<b>Simple Certificate Generated:</b>\n"
+    "• Certificate ID: {cert_id}\n"
+    "• Location: {cert_path}\n\n"
+    "Note: Full certificate features require certificate_utils module.\n"
+)
+
+CONFIRM_WIPE_TEMPLATE = (
+    "⚠️ DESTRUCTIVE OPERATION WARNING ⚠️\n\n"
+    "You are about to PERMANENTLY ERASE ALL DATA on:\n\n"
+    "Drive: {name}\n"
+    "Type: {drive_type}\n"
+    "Size: {size}\n"
+    "Path: {path}\n\n"
+    "Method: {method}\n\n"
+    "THIS ACTION CANNOT BE UNDONE!\n\n"
+    "Are you absolutely sure you want to continue?"
+)
+
 try:
     from certificate_manager import CertificateManager
     CERT_MANAGER_AVAILABLE = True
@@ -475,7 +172,6 @@ except ImportError as e:
     logger.warning(f"Certificate manager not available: {e}")
     CERT_MANAGER_AVAILABLE = False
     CertificateManager = None
-    SupabaseDesktopClient = None
 
 class ZeroTraceMainWindow(QMainWindow):
     """Main window of the ZeroTrace application"""
@@ -487,11 +183,33 @@ class ZeroTraceMainWindow(QMainWindow):
 
         # Initialize theme
         self.light_mode = False
+        
+        # Time since the last window move while dragging
+        self._drag_timer = QElapsedTimer()
 
         # Initialize wipe engine
         self.wipe_engine = WipeEngine()
         self.wipe_thread = None
+        self.drive_scan_thread = None
+        self.certificate_thread = None
+        self._certificate_wipe_result = None
+        self._logout_pending = False
+        
+        # Local certificate folder (created up front so viewing never has to check)
+        self._cert_dir = Path("certificates")
+        self._cert_dir.mkdir(exist_ok=True)
+        # (directory mtime_ns, has certificate files) from the last probe
+        self._cert_dir_cache = (None, False)
         self.current_device = None
+        self._method_cache = {}
+        self._drive_info_text = {}
+        self._last_selected_method = None
+        # Text currently shown by warning_label ("" while hidden)
+        self._last_warning_text = ""
+        
+        # Log timestamp, reformatted only when the second changes
+        self._last_ts_sec = None
+        self._last_ts_str = ""
         
         # Initialize certificate manager
         self.supabase_client = supabase_client
@@ -535,8 +253,14 @@ class ZeroTraceMainWindow(QMainWindow):
         
     def init_ui(self):
         """Initialize the user interface"""
-        # Set initial dark theme
-        self.setStyleSheet(DARK_STYLESHEET)
+        # Build the whole widget tree before any repaint; re-enabled once below
+        self.setUpdatesEnabled(False)
+        
+        # Install every theme once; the "theme" property picks which rules apply
+        self.setProperty("theme", THEMES[0])
+        self.setStyleSheet(combined_theme_stylesheet())
+        QApplication.instance().setStyleSheet(unscoped_theme_stylesheet(THEMES[0]))
+        style = self.style()
 
         titlebar = QFrame()
         titlebar.setObjectName("TitleBar")
@@ -559,32 +283,30 @@ class ZeroTraceMainWindow(QMainWindow):
         title_layout = QHBoxLayout()
 
         icon_label = QLabel()
-        icon_label.setPixmap(self.style().standardIcon(QStyle.SP_DriveHDIcon).pixmap(48, 48))
+        icon_label.setPixmap(cached_standard_pixmap(style, QStyle.SP_DriveHDIcon, 48))
         title_layout.addWidget(icon_label)
 
         title_layout.addStretch()
 
         title_label = QLabel("ZeroTrace Secure Drive Wiper")
-        title_label.setFont(QFont("Segoe UI", 24, QFont.Bold))
+        title_label.setFont(ui_font(24, bold=True))
         title_label.setAlignment(Qt.AlignCenter)
         title_layout.addWidget(title_label)
 
         title_layout.addStretch()
         header_layout.addLayout(title_layout)
         
+        # Colored by the theme's #LoggedInLabel rules (offline mode has its own)
         if self.user:
             login_status = QLabel(f"Logged in as: {self.user.email}")
-            login_status.setStyleSheet("color: #2ecc71; font-size: 18px;")
-            login_status.setAlignment(Qt.AlignCenter)
-            header_layout.addWidget(login_status)
         else:
             login_status = QLabel("⚠️ Offline Mode - Certificates saved locally only")
-            login_status.setStyleSheet("color: #f39c12; font-size: 18px;")
-            login_status.setAlignment(Qt.AlignCenter)
-            header_layout.addWidget(login_status)
+            login_status.setProperty("offline", True)
+        login_status.setAlignment(Qt.AlignCenter)
+        header_layout.addWidget(login_status)
 
         subtitle = QLabel("Hardware & Software Secure Erase Solution")
-        subtitle.setFont(QFont("Segoe UI", 12))
+        subtitle.setFont(ui_font(12))
         subtitle.setAlignment(Qt.AlignCenter)
         header_layout.addWidget(subtitle)
         
@@ -592,19 +314,19 @@ class ZeroTraceMainWindow(QMainWindow):
 
         # Create drive selection group
         drive_group = QGroupBox("Drive Selection")
-        drive_group.setFont(QFont("Segoe UI", 10, QFont.Bold))
+        drive_group.setFont(ui_font(10, bold=True))
         drive_layout = QVBoxLayout(drive_group)
         
         # Drive combo box row
         drive_section = QHBoxLayout()
         drive_label = QLabel("Select Drive:")
-        drive_label.setFont(QFont("Segoe UI", 10))
+        drive_label.setFont(ui_font(10))
         self.drive_combo = QComboBox()
-        self.drive_combo.setFont(QFont("Segoe UI", 10))
+        self.drive_combo.setFont(ui_font(10))
         self.drive_combo.currentIndexChanged.connect(self.on_drive_selected)
         
         self.refresh_button = QPushButton()
-        self.refresh_button.setIcon(self.style().standardIcon(QStyle.SP_BrowserReload))
+        self.refresh_button.setIcon(cached_standard_icon(style, QStyle.SP_BrowserReload))
         self.refresh_button.setToolTip("Refresh drive list")
         self.refresh_button.clicked.connect(self.refresh_drives)
         self.refresh_button.setFixedSize(40, 40)
@@ -616,7 +338,7 @@ class ZeroTraceMainWindow(QMainWindow):
         
         # Drive info label
         self.drive_info_label = QLabel("No drive selected")
-        self.drive_info_label.setFont(QFont("Segoe UI", 9))
+        self.drive_info_label.setFont(ui_font(9))
         self.drive_info_label.setWordWrap(True)
         drive_layout.addWidget(self.drive_info_label)
         
@@ -624,14 +346,14 @@ class ZeroTraceMainWindow(QMainWindow):
 
         # Create wipe method selection group
         method_group = QGroupBox("Wipe Method")
-        method_group.setFont(QFont("Segoe UI", 10, QFont.Bold))
+        method_group.setFont(ui_font(10, bold=True))
         method_layout = QVBoxLayout(method_group)
         
         method_section = QHBoxLayout()
         method_label = QLabel("Method:")
-        method_label.setFont(QFont("Segoe UI", 10))
+        method_label.setFont(ui_font(10))
         self.method_combo = QComboBox()
-        self.method_combo.setFont(QFont("Segoe UI", 10))
+        self.method_combo.setFont(ui_font(10))
         self.method_combo.currentIndexChanged.connect(self.on_method_changed)
         
         method_section.addWidget(method_label)
@@ -640,14 +362,14 @@ class ZeroTraceMainWindow(QMainWindow):
         
         # Method info label
         self.method_info_label = QLabel("Select a drive to see available methods")
-        self.method_info_label.setFont(QFont("Segoe UI", 9))
+        self.method_info_label.setFont(ui_font(9))
         self.method_info_label.setWordWrap(True)
         method_layout.addWidget(self.method_info_label)
         
         # Warning label
         self.warning_label = QLabel("")
-        self.warning_label.setFont(QFont("Segoe UI", 9, QFont.Bold))
-        self.warning_label.setStyleSheet("QLabel { color: #e74c3c; }")
+        self.warning_label.setFont(ui_font(9, bold=True))
+        self.warning_label.setObjectName("warningLabel")
         self.warning_label.setWordWrap(True)
         self.warning_label.setVisible(False)
         method_layout.addWidget(self.warning_label)
@@ -656,7 +378,7 @@ class ZeroTraceMainWindow(QMainWindow):
 
         # Create progress group
         progress_group = QGroupBox("Wipe Progress")
-        progress_group.setFont(QFont("Segoe UI", 10, QFont.Bold))
+        progress_group.setFont(ui_font(10, bold=True))
         progress_layout = QVBoxLayout(progress_group)
         
         self.progress_bar = QProgressBar()
@@ -665,22 +387,42 @@ class ZeroTraceMainWindow(QMainWindow):
         progress_layout.addWidget(self.progress_bar)
         
         self.status_label = QLabel("Ready")
-        self.status_label.setFont(QFont("Segoe UI", 10))
+        self.status_label.setFont(ui_font(10))
         self.status_label.setAlignment(Qt.AlignCenter)
         progress_layout.addWidget(self.status_label)
         
+        # Latest progress from the wipe thread, applied to the widgets by timer
+        self._pending_progress = None
+        self._pending_status = None
+        self._last_status_key = None
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(PROGRESS_APPLY_INTERVAL_MS)
+        self._progress_timer.timeout.connect(self._apply_pending_progress)
+        
         main_layout.addWidget(progress_group)
 
         # Create log display
         log_group = QGroupBox("Operation Log")
-        log_group.setFont(QFont("Segoe UI", 10, QFont.Bold))
+        log_group.setFont(ui_font(10, bold=True))
         log_layout = QVBoxLayout(log_group)
         
-        self.log_display = QTextEdit()
+        # Plain text only: no HTML parsing per line and no undo history
+        self.log_display = QPlainTextEdit()
         self.log_display.setReadOnly(True)
+        self.log_display.setUndoRedoEnabled(False)
+        self.log_display.setFont(mono_font(10))
         self.log_display.setMaximumHeight(150)
+        self.log_display.setMaximumBlockCount(LOG_MAX_BLOCKS)
         log_layout.addWidget(self.log_display)
         
+        # Log lines are buffered and flushed to the display in batches
+        self._log_buffer = deque()
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(LOG_FLUSH_INTERVAL_MS)
+        self._log_flush_timer.timeout.connect(self._flush_log)
+        
         main_layout.addWidget(log_group)
 
         # Create footer bar
@@ -691,36 +433,40 @@ class ZeroTraceMainWindow(QMainWindow):
 
         self.start_button = QPushButton("Start Wiping")
         self.start_button.setObjectName("startButton")
-        self.start_button.setFont(QFont("Segoe UI", 10, QFont.Bold))
-        self.start_button.setIcon(self.style().standardIcon(QStyle.SP_MediaPlay))
+        self.start_button.setFont(ui_font(10, bold=True))
+        self.start_button.setIcon(cached_standard_icon(style, QStyle.SP_MediaPlay))
         self.start_button.clicked.connect(self.start_wipe)
         self.start_button.setMinimumHeight(40)
 
         self.stop_button = QPushButton("Stop")
         self.stop_button.setObjectName("stopButton")
-        self.stop_button.setFont(QFont("Segoe UI", 10, QFont.Bold))
-        self.stop_button.setIcon(self.style().standardIcon(QStyle.SP_MediaStop))
+        self.stop_button.setFont(ui_font(10, bold=True))
+        self.stop_button.setIcon(cached_standard_icon(style, QStyle.SP_MediaStop))
         self.stop_button.clicked.connect(self.stop_wipe)
         self.stop_button.setEnabled(False)
         self.stop_button.setMinimumHeight(40)
 
         self.logout_button = QPushButton("Logout")
         self.logout_button.setObjectName("logoutButton")
-        self.logout_button.setFont(QFont("Segoe UI", 10, QFont.Bold))
-        self.logout_button.setIcon(self.style().standardIcon(QStyle.SP_DialogCloseButton))
+        self.logout_button.setFont(ui_font(10, bold=True))
+        self.logout_button.setIcon(cached_standard_icon(style, QStyle.SP_DialogCloseButton))
         self.logout_button.clicked.connect(self.logout)
         self.logout_button.setMinimumHeight(40)
 
+        # Controls locked while a wipe is running (stop_button is inverted)
+        self._busy_widgets = (self.start_button, self.refresh_button, self.drive_combo,
+                              self.method_combo, self.logout_button)
+
         self.view_certs_button = QPushButton("View Certificates")
-        self.view_certs_button.setFont(QFont("Segoe UI", 10, QFont.Bold))
-        self.view_certs_button.setIcon(self.style().standardIcon(QStyle.SP_FileDialogDetailedView))
+        self.view_certs_button.setFont(ui_font(10, bold=True))
+        self.view_certs_button.setIcon(cached_standard_icon(style, QStyle.SP_FileDialogDetailedView))
         self.view_certs_button.clicked.connect(self.view_certificates)
         self.view_certs_button.setMinimumHeight(40)
 
         # Add this after the "View Certificates" button code:
         self.sync_certs_button = QPushButton("Sync to Cloud")
-        self.sync_certs_button.setFont(QFont("Segoe UI", 10, QFont.Bold))
-        self.sync_certs_button.setIcon(self.style().standardIcon(QStyle.SP_ArrowUp))
+        self.sync_certs_button.setFont(ui_font(10, bold=True))
+        self.sync_certs_button.setIcon(cached_standard_icon(style, QStyle.SP_ArrowUp))
         self.sync_certs_button.clicked.connect(self.sync_certificates_to_cloud)
         self.sync_certs_button.setMinimumHeight(40)
 
@@ -730,7 +476,7 @@ class ZeroTraceMainWindow(QMainWindow):
         login_status.setObjectName("LoggedInLabel")
 
         self.themeToggle = QPushButton("Light Mode")
-        self.themeToggle.setFont(QFont("Segoe UI", 10, QFont.Bold))
+        self.themeToggle.setFont(ui_font(10, bold=True))
         self.themeToggle.clicked.connect(self.toggle_theme)
         self.themeToggle.setMinimumHeight(40)
 
@@ -747,44 +493,114 @@ class ZeroTraceMainWindow(QMainWindow):
 
         main_layout.addWidget(footer)
         
+        # Message boxes reused for every notification and confirmation
+        # (their messages are plain text, so skip Qt's rich-text detection)
+        self._msg = QMessageBox(self)
+        self._msg.setTextFormat(Qt.PlainText)
+        self._msg.setStandardButtons(QMessageBox.Ok)
+        self._confirm_box = QMessageBox(self)
+        self._confirm_box.setTextFormat(Qt.PlainText)
+        self._confirm_box.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
+        
+        # Wipe-complete certificate dialog, reused for every completed wipe
+        self._cert_msg = QMessageBox(self)
+        self._cert_msg.setIcon(QMessageBox.Information)
+        self._cert_msg.setWindowTitle("✓ Wipe Complete - Certificate Generated")
+        self._cert_msg.setText("Drive wiping completed successfully!")
+        self._cert_msg.setStandardButtons(QMessageBox.Ok)
+        self._cert_folder_btn = self._cert_msg.addButton("Open Certificate Folder", QMessageBox.ActionRole)
+        self._cert_pdf_btn = self._cert_msg.addButton("View PDF Certificate", QMessageBox.ActionRole)
+        self._cert_msg.buttonClicked.connect(self._on_cert_dialog_clicked)
+        self._cert_folder_path = None
+        self._cert_pdf_path = None
+        
+        self.setUpdatesEnabled(True)
+        
         # Initialize drives list
         self.refresh_drives()
         self.log("ZeroTrace initialized. Select a drive to begin.")
     
     def log(self, message: str):
-        """Add message to log display"""
-        self.log_display.append(f"[{self._get_timestamp()}] {message}")
+        """Queue message for the log display"""
+        self._log_buffer.append(f"[{self._get_timestamp()}] {message}")
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
+    
+    def _flush_log(self):
+        """Append all queued log messages to the display at once"""
+        if not self._log_buffer:
+            return
+        
+        self.log_display.appendPlainText("\n".join(self._log_buffer))
+        self._log_buffer.clear()
         self.log_display.moveCursor(QTextCursor.End)
     
     def toggle_theme(self):
         if self.light_mode:
-            self.setStyleSheet(DARK_STYLESHEET)
             self.themeToggle.setText("☀ Light Mode")
             self.light_mode = False
         else:
-            self.setStyleSheet(LIGHT_STYLESHEET)
             self.themeToggle.setText("🌙 Dark Mode")
             self.light_mode = True
+        
+        # Property selectors are only re-evaluated on polish. Swapping the (tiny)
+        # application sheet, which holds the active theme's tooltip rules, repolishes
+        # every styled widget without reparsing the main window's stylesheet.
+        theme = "light" if self.light_mode else "dark"
+        self.setProperty("theme", theme)
+        QApplication.instance().setStyleSheet(unscoped_theme_stylesheet(theme))
+        self.update()
+    
     def mousePressEvent(self, event):
         if event.button() == Qt.LeftButton:
             self.dragPos = event.globalPos()
+            self._drag_timer.start()
 
     def mouseMoveEvent(self, event):
-        if event.buttons() == Qt.LeftButton:
-            self.move(self.pos() + (event.globalPos() - self.dragPos))
-            self.dragPos = event.globalPos()
+        # Skipped events leave dragPos behind, so the next move covers their distance too
+        if event.buttons() == Qt.LeftButton and self._drag_timer.elapsed() >= DRAG_MOVE_INTERVAL_MS:
+            self._drag_to(event.globalPos())
+
+    def mouseReleaseEvent(self, event):
+        if event.button() == Qt.LeftButton and self._drag_timer.isValid():
+            self._drag_to(event.globalPos())
+            self._drag_timer.invalidate()
+
+    def _drag_to(self, global_pos):
+        """Move the window by the cursor's travel since the last move"""
+        if global_pos != self.dragPos:
+            self.move(self.pos() + (global_pos - self.dragPos))
+            self.dragPos = global_pos
+        self._drag_timer.restart()
+
     def _get_timestamp(self) -> str:
         """Get current timestamp"""
-        from datetime import datetime
-        return datetime.now().strftime("%H:%M:%S")
+        now = int(time.time())
+        if now != self._last_ts_sec:
+            self._last_ts_sec = now
+            self._last_ts_str = time.strftime("%H:%M:%S", time.localtime(now))
+        return self._last_ts_str
     
     def refresh_drives(self):
-        """Refresh the list of available drives"""
+        """Refresh the list of available drives (scanned on a worker thread)"""
+        if self.drive_scan_thread and self.drive_scan_thread.isRunning():
+            return
+        
         self.log("Scanning for available drives...")
+        self.refresh_button.setEnabled(False)
         self.drive_combo.clear()
         self.current_device = None
+        self._method_cache.clear()
+        self._drive_info_text.clear()
+        self.drive_info_label.setText("Scanning for drives...")
         
-        drives = self.wipe_engine.get_available_drives()
+        self.drive_scan_thread = DriveScanThread()
+        self.drive_scan_thread.drives_ready.connect(self._on_drives_ready, Qt.QueuedConnection)
+        self.drive_scan_thread.start()
+    
+    def _on_drives_ready(self, drives):
+        """Populate the drive list once the scan has finished"""
+        self.refresh_button.setEnabled(self.wipe_thread is None)
         
         if not drives:
             self.log("No suitable drives found. Connect a removable drive.")
@@ -793,73 +609,111 @@ class ZeroTraceMainWindow(QMainWindow):
             self.method_info_label.setText("No drive selected")
             return
         
+        items = []
+        for drive in drives:
+            item = QStandardItem(f"{drive.name} ({drive.size_display}) - {drive.drive_type.value}")
+            item.setData(drive, Qt.UserRole)
+            items.append(item)
+        
+        # Drive info label text, built once per scan
         for drive in drives:
-            display_text = f"{drive.name} ({drive.size_gb:.2f} GB) - {drive.drive_type.value}"
-            self.drive_combo.addItem(display_text, drive)
+            info_text = (
+                f"Type: {drive.drive_type.value} | "
+                f"Size: {drive.size_display} | "
+                f"Model: {drive.model or 'Unknown'} | "
+                f"Serial: {drive.serial or 'N/A'}"
+            )
+            if drive.is_frozen:
+                info_text += " | ⚠️ FROZEN - Power cycle required"
+            self._drive_info_text[drive.path] = info_text
+        
+        # Insert all rows into the combo's model at once, without
+        # currentIndexChanged/repaint, then select once
+        self.drive_combo.setUpdatesEnabled(False)
+        self.drive_combo.blockSignals(True)
+        try:
+            self.drive_combo.model().invisibleRootItem().appendRows(items)
+        finally:
+            self.drive_combo.blockSignals(False)
+            self.drive_combo.setUpdatesEnabled(True)
         
         self.log(f"Found {len(drives)} drive(s)")
+        self.on_drive_selected(self.drive_combo.currentIndex())
     
     def on_drive_selected(self, index: int):
         """Handle drive selection change"""
         if index < 0:
             return
         
-        self.current_device = self.drive_combo.itemData(index)
+        device = self.drive_combo.itemData(index)
+        if device is self.current_device:
+            return
+        self.current_device = device
         
         if not self.current_device:
             return
         
         # Update drive info
-        info_text = (
-            f"Type: {self.current_device.drive_type.value} | "
-            f"Size: {self.current_device.size_gb:.2f} GB | "
-            f"Model: {self.current_device.model or 'Unknown'} | "
-            f"Serial: {self.current_device.serial or 'N/A'}"
-        )
-        
-        if self.current_device.is_frozen:
-            info_text += " | ⚠️ FROZEN - Power cycle required"
-        
-        self.drive_info_label.setText(info_text)
+        self.drive_info_label.setText(self._drive_info_text[self.current_device.path])
         
         self.log(f"Selected drive: {self.current_device.name}")
         self.log(f"  Type: {self.current_device.drive_type.value}")
-        self.log(f"  Size: {self.current_device.size_gb:.2f} GB")
+        self.log(f"  Size: {self.current_device.size_display}")
         
         # Update method combo box
         self.update_method_combo()
     
+    def _get_methods(self, device) -> Tuple[List[str], Dict[str, str]]:
+        """Get a device's supported and recommended wipe methods (cached until the next refresh)"""
+        key = (device.path, device.serial)
+        methods = self._method_cache.get(key)
+        if methods is None:
+            methods = (
+                self.wipe_engine.get_supported_methods(device),
+                self.wipe_engine.detect_best_wipe_method(device)
+            )
+            self._method_cache[key] = methods
+        return methods
+    
+    def _get_best_method(self, device) -> Dict[str, str]:
+        """Get the recommended wipe method for a device (cached until the next refresh)"""
+        return self._get_methods(device)[1]
+    
     def update_method_combo(self):
         """Update available wipe methods based on selected drive"""
-        self.method_combo.clear()
+        self._last_selected_method = None
         
         if not self.current_device:
+            self.method_combo.clear()
             return
         
-        # Get supported methods
-        supported_methods = self.wipe_engine.get_supported_methods(self.current_device)
-        
-        # Get recommended method
-        best_method = self.wipe_engine.detect_best_wipe_method(self.current_device)
+        # Get supported and recommended methods
+        supported_methods, best_method = self._get_methods(self.current_device)
         recommended_method = best_method['method']
         
         self.log(f"Recommended method: {recommended_method}")
         self.log(f"  Reason: {best_method['reason']}")
         
-        # Populate combo box
-        for method in supported_methods:
-            if method == recommended_method:
-                display_text = f"{method} (Recommended)"
-            else:
-                display_text = method
+        # Repopulate and select without intermediate currentIndexChanged signals
+        self.method_combo.blockSignals(True)
+        try:
+            self.method_combo.clear()
+            for method in supported_methods:
+                if method == recommended_method:
+                    display_text = f"{method} (Recommended)"
+                else:
+                    display_text = method
+                
+                self.method_combo.addItem(display_text, method)
             
-            self.method_combo.addItem(display_text, method)
+            # Select recommended method
+            recommended_index = self.method_combo.findData(recommended_method)
+            if recommended_index >= 0:
+                self.method_combo.setCurrentIndex(recommended_index)
+        finally:
+            self.method_combo.blockSignals(False)
         
-        # Select recommended method
-        for i in range(self.method_combo.count()):
-            if self.method_combo.itemData(i) == recommended_method:
-                self.method_combo.setCurrentIndex(i)
-                break
+        self.on_method_changed(self.method_combo.currentIndex())
         
         # Update info label
         self.method_info_label.setText(best_method['reason'])
@@ -870,34 +724,23 @@ class ZeroTraceMainWindow(QMainWindow):
             return
         
         selected_method = self.method_combo.itemData(index)
-        best_method = self.wipe_engine.detect_best_wipe_method(self.current_device)
+        if selected_method == self._last_selected_method:
+            return
+        self._last_selected_method = selected_method
+        best_method = self._get_best_method(self.current_device)
         
         # Check if user selected inferior method
-        warnings = []
-        
-        # SSD warnings
-        if self.current_device.drive_type in [DriveType.SATA_SSD, DriveType.NVME_SSD]:
-            if selected_method in [WipeMethod.DOD_3_PASS, WipeMethod.DOD_7_PASS, WipeMethod.GUTMANN_35_PASS]:
-                warnings.append("⚠️ Multi-pass overwrite is not recommended for SSDs and may reduce lifespan.")
-        
-        # Frozen drive warnings
-        if self.current_device.is_frozen:
-            if selected_method in [WipeMethod.ATA_SECURE_ERASE, WipeMethod.ATA_ENHANCED_SECURE_ERASE]:
-                warnings.append("⚠️ Drive is frozen. ATA Secure Erase will fail. Power cycle the drive first.")
-        
-        # Incompatible method warnings
-        if selected_method == WipeMethod.ATA_SECURE_ERASE and not self.current_device.supports_ata_secure_erase:
-            warnings.append("⚠️ This drive does not support ATA Secure Erase.")
-        
-        if selected_method == WipeMethod.NVME_FORMAT and not self.current_device.supports_nvme_format:
-            warnings.append("⚠️ This drive does not support NVMe Format.")
-        
-        # Show warnings
-        if warnings:
-            self.warning_label.setText("\n".join(warnings))
-            self.warning_label.setVisible(True)
-        else:
-            self.warning_label.setVisible(False)
+        device = self.current_device
+        warnings = [message for predicate, message in METHOD_WARNING_RULES
+                    if predicate(device, selected_method)]
+        
+        # Show warnings (the label is only touched when they change)
+        warning_text = "\n".join(warnings)
+        if warning_text != self._last_warning_text:
+            self._last_warning_text = warning_text
+            if warning_text:
+                self.warning_label.setText(warning_text)
+            self.warning_label.setVisible(bool(warning_text))
         
         # Log method change
         if selected_method != best_method['method']:
@@ -906,119 +749,170 @@ class ZeroTraceMainWindow(QMainWindow):
     def start_wipe(self):
         """Start the drive wiping process"""
         if not self.current_device:
-            QMessageBox.warning(self, "No Drive Selected", "Please select a drive first.")
+            self._show(QMessageBox.Warning, "No Drive Selected", "Please select a drive first.")
             return
         
         if self.method_combo.currentIndex() < 0:
-            QMessageBox.warning(self, "No Method Selected", "Please select a wipe method.")
+            self._show(QMessageBox.Warning, "No Method Selected", "Please select a wipe method.")
             return
         
         selected_method = self.method_combo.itemData(self.method_combo.currentIndex())
         
         # Build confirmation message
-        confirm_msg = (
-            f"⚠️ DESTRUCTIVE OPERATION WARNING ⚠️\n\n"
-            f"You are about to PERMANENTLY ERASE ALL DATA on:\n\n"
-            f"Drive: {self.current_device.name}\n"
-            f"Type: {self.current_device.drive_type.value}\n"
-            f"Size: {self.current_device.size_gb:.2f} GB\n"
-            f"Path: {self.current_device.path}\n\n"
-            f"Method: {selected_method}\n\n"
-            f"THIS ACTION CANNOT BE UNDONE!\n\n"
-            f"Are you absolutely sure you want to continue?"
+        confirm_msg = CONFIRM_WIPE_TEMPLATE.format(
+            name=self.current_device.name,
+            drive_type=self.current_device.drive_type.value,
+            size=self.current_device.size_display,
+            path=self.current_device.path,
+            method=selected_method
         )
         
-        reply = QMessageBox.warning(
-            self,
+        confirmed = self._confirm(
+            QMessageBox.Warning,
             "⚠️ Confirm Destructive Operation",
-            confirm_msg,
-            QMessageBox.Yes | QMessageBox.No,
-            QMessageBox.No
+            confirm_msg
         )
         
-        if reply != QMessageBox.Yes:
+        if not confirmed:
             self.log("Wipe operation cancelled by user")
             return
         
         # Disable UI
-        self.start_button.setEnabled(False)
-        self.stop_button.setEnabled(True)
-        self.refresh_button.setEnabled(False)
-        self.drive_combo.setEnabled(False)
-        self.method_combo.setEnabled(False)
-        self.logout_button.setEnabled(False)
+        self._set_busy(True)
         
-        self.log("="*50)
+        self.log(LOG_SEPARATOR)
         self.log(f"Starting wipe operation: {selected_method}")
         self.log(f"Target: {self.current_device.name}")
-        self.log("="*50)
+        self.log(LOG_SEPARATOR)
         
-        # Create and start wipe thread
+        # Create and start wipe thread (a previous one has already reported its
+        # result and is only exiting, so this wait is brief)
+        if self.wipe_thread is not None:
+            self.wipe_thread.wait()
+        self._last_status_key = None
         self.wipe_thread = WipeThread(
             self.current_device,
             selected_method,
             True
         )
-        self.wipe_thread.progress_updated.connect(self.on_progress_update)
-        self.wipe_thread.wipe_completed.connect(self.wipe_finished)
-        self.wipe_thread.wipe_failed.connect(self.wipe_failed)
+        self.wipe_thread.progress_updated.connect(self.on_progress_update, Qt.QueuedConnection)
+        self.wipe_thread.wipe_completed.connect(self.wipe_finished, Qt.QueuedConnection)
+        self.wipe_thread.wipe_failed.connect(self.wipe_failed, Qt.QueuedConnection)
+        self.wipe_thread.finished.connect(self._on_wipe_thread_finished, Qt.QueuedConnection)
         self.wipe_thread.start()
     
+    def _on_wipe_thread_finished(self):
+        """Drop the wipe thread only once it has exited (its result slots run earlier)"""
+        if self.wipe_thread is not None and not self.wipe_thread.isRunning():
+            # finished is emitted just before the thread actually exits
+            self.wipe_thread.wait()
+            self.wipe_thread = None
+    
+    def _set_busy(self, busy: bool):
+        """Lock or unlock the wipe controls in a single repaint"""
+        central = self.centralWidget()
+        central.setUpdatesEnabled(False)
+        try:
+            for widget in self._busy_widgets:
+                widget.setEnabled(not busy)
+            self.stop_button.setEnabled(busy)
+        finally:
+            central.setUpdatesEnabled(True)
+    
+    def _show(self, icon, title: str, text: str):
+        """Show a window-modal notification using the shared message box (returns immediately)"""
+        msg = self._msg
+        if msg.isVisible():
+            # Don't overwrite a notification that is still on screen
+            msg = QMessageBox(self)
+            msg.setAttribute(Qt.WA_DeleteOnClose)
+            msg.setTextFormat(Qt.PlainText)
+            msg.setStandardButtons(QMessageBox.Ok)
+        msg.setIcon(icon)
+        msg.setWindowTitle(title)
+        msg.setText(text)
+        msg.open()
+    
+    def _confirm(self, icon, title: str, text: str) -> bool:
+        """Ask a Yes/No question (defaulting to No) using the shared confirmation box"""
+        self._confirm_box.setIcon(icon)
+        self._confirm_box.setWindowTitle(title)
+        self._confirm_box.setText(text)
+        self._confirm_box.setDefaultButton(QMessageBox.No)
+        return self._confirm_box.exec_() == QMessageBox.Yes
+    
     def stop_wipe(self):
         """Stop the drive wiping process"""
         if self.wipe_thread and self.wipe_thread.isRunning():
-            reply = QMessageBox.question(
-                self,
+            confirmed = self._confirm(
+                QMessageBox.Question,
                 "Confirm Stop",
                 "Are you sure you want to stop the wiping process?\n\n"
-                "Stopping may leave the drive in an inconsistent state.",
-                QMessageBox.Yes | QMessageBox.No,
-                QMessageBox.No
+                "Stopping may leave the drive in an inconsistent state."
             )
 
-            if reply == QMessageBox.Yes:
+            if confirmed:
                 self.log("Stop requested by user...")
                 self.wipe_thread.stop()
                 self.logout_button.setEnabled(True)
     
     def on_progress_update(self, progress, message):
         """Handle progress update from wipe thread"""
-        self.progress_bar.setValue(progress)
-        self.status_label.setText(message)
-        self.log(message)
+        self._pending_progress = progress
+        self._pending_status = message
+        
+        # Log phase changes only, not every percentage tick
+        status_key = progress_phase(message)
+        if status_key != self._last_status_key:
+            self._last_status_key = status_key
+            self.log(message)
+        
+        if not self._progress_timer.isActive():
+            self._progress_timer.start()
+    
+    def _apply_pending_progress(self):
+        """Apply the latest pending progress to the progress bar and status label"""
+        self._progress_timer.stop()
+        
+        if self._pending_progress is not None and self._pending_progress != self.progress_bar.value():
+            self.progress_bar.setValue(self._pending_progress)
+        if self._pending_status is not None and self._pending_status != self.status_label.text():
+            self.status_label.setText(self._pending_status)
+        
+        self._pending_progress = None
+        self._pending_status = None
+        
     def wipe_failed(self, error_message):
         """Handle wipe failure"""
-        self.start_button.setEnabled(True)
-        self.stop_button.setEnabled(False)
-        self.refresh_button.setEnabled(True)
-        self.drive_combo.setEnabled(True)
-        self.method_combo.setEnabled(True)
-        self.logout_button.setEnabled(True)
-        self.wipe_thread = None
+        self._apply_pending_progress()
+        self._set_busy(False)
 
-        self.log("="*50)
+        self.log(LOG_SEPARATOR)
         self.log(f"❌ Wipe FAILED: {error_message}")
-        self.log("="*50)
+        self.log(LOG_SEPARATOR)
 
-        QMessageBox.critical(
-            self,
+        if self._logout_pending:
+            self._close_when_idle()
+            return
+
+        self._show(
+            QMessageBox.Critical,
             "❌ Wipe Failed",
             f"An error occurred during wiping:\n\n{error_message}\n\n"
-            f"Please check the log for details.",
-            QMessageBox.Ok
+            f"Please check the log for details."
         )
     
     def wipe_finished(self, result):
         """Handle wipe completion with certificate generation"""
-        self.start_button.setEnabled(True)
-        self.stop_button.setEnabled(False)
-        self.refresh_button.setEnabled(True)
-        self.drive_combo.setEnabled(True)
-        self.method_combo.setEnabled(True)
-        self.logout_button.setEnabled(True)
-        self.wipe_thread = None
+        self._apply_pending_progress()
+        certify = result.get('success') and result.get('status') == 'Completed'
+        if certify and not self._logout_pending:
+            # Keep the controls locked until the certificate job reports back
+            self.stop_button.setEnabled(False)
+        else:
+            self._set_busy(False)
         
-        self.log("="*50)
+        self.log(LOG_SEPARATOR)
         self.log(f"Wipe completed: {result['status']}")
         self.log(f"Method: {result['method']}")
         self.log(f"Duration: {result['duration']}")
@@ -1026,10 +920,14 @@ class ZeroTraceMainWindow(QMainWindow):
             self.log(f"Passes: {result['passes_completed']}")
         if result.get('completion_hash'):
             self.log(f"Hash: {result['completion_hash'][:16]}...")
-        self.log("="*50)
+        self.log(LOG_SEPARATOR)
+        
+        if self._logout_pending:
+            self._close_when_idle()
+            return
         
         # Generate certificate if wipe was successful
-        if result.get('success') and result.get('status') == 'Completed':
+        if certify:
             self.generate_certificate(result)
         else:
             # Show completion dialog without certificate
@@ -1043,6 +941,7 @@ class ZeroTraceMainWindow(QMainWindow):
             
             if not self.certificate_manager:
                 self.log("⚠️ Certificate manager not available")
+                self._set_busy(False)
                 self._create_simple_certificate(wipe_result)
                 return
             
@@ -1065,89 +964,76 @@ class ZeroTraceMainWindow(QMainWindow):
             
             self.log(f"Certificate data prepared: {cert_wipe_data['device_name']}")
             
-            # Generate and sign certificate
+            # Generate, sign and upload on a worker thread; results arrive via signals
             self.log("Creating signed certificate...")
-            json_path, pdf_path, cert_data = self.certificate_manager.generate_and_sign_certificate(cert_wipe_data)
-            
-            self.log(f"✓ Certificate generated: {cert_data['cert_id']}")
-            self.log(f"  JSON: {json_path}")
-            self.log(f"  PDF: {pdf_path}")
-            
-            # Try to upload certificate if user is logged in
-            uploaded = False
-            if self.supabase_client and hasattr(self.supabase_client, 'user') and self.supabase_client.user:
-                self.log("Uploading certificate to cloud...")
-                try:
-                    uploaded = self.certificate_manager.upload_certificate(json_path, pdf_path, cert_data)
-                    
-                    if uploaded:
-                        self.log("✓ Certificate uploaded successfully")
-                    else:
-                        self.log("⚠️ Certificate upload failed - saved locally")
-                except Exception as upload_err:
-                    self.log(f"⚠️ Upload error: {upload_err}")
-                    uploaded = False
-            else:
-                self.log("ℹ️ Not logged in - certificate saved locally only")
-            
-            # Show completion dialog with certificate info
-            self._show_wipe_complete_with_cert(wipe_result, cert_data, json_path, pdf_path, uploaded)
+            upload = bool(self.supabase_client and hasattr(self.supabase_client, 'user') and self.supabase_client.user)
+            # A previous job has already reported back (controls stay busy until then)
+            if self.certificate_thread is not None:
+                self.certificate_thread.wait()
+            self._certificate_wipe_result = wipe_result
+            self.certificate_thread = CertificateThread(self.certificate_manager, cert_wipe_data, upload)
+            self.certificate_thread.log_message.connect(self.log, Qt.QueuedConnection)
+            self.certificate_thread.certificate_ready.connect(self._on_certificate_ready, Qt.QueuedConnection)
+            self.certificate_thread.certificate_failed.connect(self._on_certificate_failed, Qt.QueuedConnection)
+            self.certificate_thread.start()
             
         except Exception as e:
-            logger.error(f"Certificate generation failed: {e}", exc_info=True)
-            self.log(f"❌ Certificate generation failed: {str(e)}")
-            
-            # Try to create simple certificate as fallback
-            try:
-                self._create_simple_certificate(wipe_result)
-            except:
-                self._show_wipe_complete_without_cert(wipe_result)
+            logger.error("Certificate generation failed: %s", e, exc_info=True)
+            self._on_certificate_failed(str(e), wipe_result)
+    
+    def _on_certificate_ready(self, json_path, pdf_path, cert_data: Dict, uploaded: bool):
+        """Show the completion dialog once the certificate thread has finished"""
+        self._set_busy(False)
+        self._cert_dir_cache = (None, False)
+        self._show_wipe_complete_with_cert(self._certificate_wipe_result, cert_data, json_path, pdf_path, uploaded)
+    
+    def _on_certificate_failed(self, error_message: str, wipe_result: Dict = None):
+        """Fall back to a simple text certificate when signed generation fails"""
+        self._set_busy(False)
+        if wipe_result is None:
+            wipe_result = self._certificate_wipe_result
+        self.log(f"❌ Certificate generation failed: {error_message}")
+        
+        # Try to create simple certificate as fallback
+        try:
+            self._create_simple_certificate(wipe_result)
+        except:
+            self._show_wipe_complete_without_cert(wipe_result)
 
     def _create_simple_certificate(self, wipe_result: Dict):
         """Create a simple text certificate as fallback"""
         try:
             self.log("Creating simple text certificate...")
             
-            # Create certificates directory
-            cert_dir = Path("certificates")
+            # Create certificates directory (in case it was removed meanwhile)
+            cert_dir = self._cert_dir
             cert_dir.mkdir(exist_ok=True)
             
-            # Generate simple certificate ID
-            import hashlib
-            cert_id = hashlib.sha256(
-                f"{wipe_result.get('device_id')}_{datetime.now().isoformat()}".encode()
-            ).hexdigest()[:16]
+            # Generate simple certificate ID (16 hex chars)
+            now = datetime.now()
+            cert_id = hashlib.blake2b(
+                f"{wipe_result.get('device_id')}_{now.isoformat()}".encode(),
+                digest_size=8
+            ).hexdigest()
             
             # Create text certificate
-            cert_content = f"""
-ZEROTRACE WIPE CERTIFICATE
-{'='*60}
-
-Certificate ID: {cert_id}
-Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-
-DEVICE INFORMATION:
-- Device: {wipe_result.get('device_name', 'Unknown')}
-- Model: {wipe_result.get('device_model', 'N/A')}
-- Serial: {wipe_result.get('device_serial', 'N/A')}
-- Size: {wipe_result.get('device_size', 0) / (1024**3):.2f} GB
-- Type: {wipe_result.get('device_type', 'Unknown')}
-
-WIPE DETAILS:
-- Method: {wipe_result.get('method', 'Unknown')}
-- Status: {wipe_result.get('status', 'Unknown')}
-- Passes: {wipe_result.get('passes_completed', 'N/A')}
-- Duration: {wipe_result.get('duration', 'N/A')}
-- Start: {wipe_result.get('start_time', 'N/A')}
-- End: {wipe_result.get('end_time', 'N/A')}
-
-VERIFICATION:
-- Hash: {wipe_result.get('completion_hash', 'N/A')}
-
-{'='*60}
-This certificate verifies that the above device was securely
-wiped using ZeroTrace secure wipe application.
-"""
+            cert_content = SIMPLE_CERT_TEMPLATE.format(
+                separator=CERT_SEPARATOR,
+                cert_id=cert_id,
+                generated=now.strftime('%Y-%m-%d %H:%M:%S'),
+                device_name=wipe_result.get('device_name', 'Unknown'),
+                device_model=wipe_result.get('device_model', 'N/A'),
+                device_serial=wipe_result.get('device_serial', 'N/A'),
+                device_gb=wipe_result.get('device_size', 0) / (1024**3),
+                device_type=wipe_result.get('device_type', 'Unknown'),
+                method=wipe_result.get('method', 'Unknown'),
+                status=wipe_result.get('status', 'Unknown'),
+                passes=wipe_result.get('passes_completed', 'N/A'),
+                duration=wipe_result.get('duration', 'N/A'),
+                start_time=wipe_result.get('start_time', 'N/A'),
+                end_time=wipe_result.get('end_time', 'N/A'),
+                completion_hash=wipe_result.get('completion_hash', 'N/A')
+            )
             
             # Save certificate
             cert_path = cert_dir / f"{cert_id}.txt"
@@ -1155,36 +1041,17 @@ wiped using ZeroTrace secure wipe application.
                 f.write(cert_content)
             
             self.log(f"✓ Simple certificate created: {cert_path}")
+            self._cert_dir_cache = (None, False)
             
             # Show completion dialog
-            msg = QMessageBox(self)
-            msg.setIcon(QMessageBox.Information)
-            msg.setWindowTitle("✓ Wipe Complete - Certificate Generated")
-            msg.setText("Drive wiping completed successfully!")
-            
-            details = f"""
-<b>Wipe Details:</b>
-• Method: {wipe_result['method']}
-• Duration: {wipe_result['duration']}
-• Status: {wipe_result['status']}
-
-<b>Simple Certificate Generated:</b>
-• Certificate ID: {cert_id}
-• Location: {cert_path}
-
-Note: Full certificate features require certificate_utils module.
-            """
-            
-            msg.setInformativeText(details)
-            msg.setStandardButtons(QMessageBox.Ok)
-            
-            # Add button to open certificate folder
-            open_folder_btn = msg.addButton("Open Certificate Folder", QMessageBox.ActionRole)
-            
-            msg.exec_()
-            
-            if msg.clickedButton() == open_folder_btn:
-                self._open_certificate_folder(cert_dir)
+            details = SIMPLE_CERT_DETAILS_TEMPLATE.format_map({
+                'method': wipe_result['method'],
+                'duration': wipe_result['duration'],
+                'status': wipe_result['status'],
+                'cert_id': cert_id,
+                'cert_path': cert_path,
+            })
+            self._open_cert_dialog(details, cert_dir, None)
                 
         except Exception as e:
             logger.error(f"Simple certificate creation failed: {e}")
@@ -1195,142 +1062,130 @@ Note: Full certificate features require certificate_utils module.
         """Show completion dialog with certificate information"""
         upload_status = "✓ Uploaded to cloud" if uploaded else "⚠️ Saved locally only"
         
-        msg = QMessageBox(self)
-        msg.setIcon(QMessageBox.Information)
-        msg.setWindowTitle("✓ Wipe Complete - Certificate Generated")
-        msg.setText("Drive wiping completed successfully!")
-        
-        details = f"""
-<b>Wipe Details:</b>
-• Method: {wipe_result['method']}
-• Duration: {wipe_result['duration']}
-• Passes: {wipe_result.get('passes_completed', 'N/A')}
-• Status: {wipe_result['status']}
-
-<b>Certificate Generated:</b>
-• Certificate ID: {cert_data['cert_id']}
-• Status: {upload_status}
-
-<b>Files Saved:</b>
-• JSON: {json_path.name}
-• PDF: {pdf_path.name}
-
-<b>Location:</b>
-{json_path.parent}
-        """
-        
-        msg.setInformativeText(details)
-        msg.setStandardButtons(QMessageBox.Ok)
-        
-        # Add buttons
-        open_folder_btn = msg.addButton("Open Certificate Folder", QMessageBox.ActionRole)
-        open_pdf_btn = msg.addButton("View PDF Certificate", QMessageBox.ActionRole)
-        
-        msg.exec_()
-        
-        # Handle button clicks
-        clicked_button = msg.clickedButton()
-        if clicked_button == open_folder_btn:
-            self._open_certificate_folder(json_path.parent)
-        elif clicked_button == open_pdf_btn:
-            self._open_pdf_certificate(pdf_path)
+        details = CERT_DETAILS_TEMPLATE.format_map({
+            'method': wipe_result['method'],
+            'duration': wipe_result['duration'],
+            'passes': wipe_result.get('passes_completed', 'N/A'),
+            'status': wipe_result['status'],
+            'cert_id': cert_data['cert_id'],
+            'upload_status': upload_status,
+            'json_name': json_path.name,
+            'pdf_name': pdf_path.name,
+            'location': json_path.parent,
+        })
+        self._open_cert_dialog(details, json_path.parent, pdf_path)
+    
+    def _open_cert_dialog(self, details: str, folder_path: Path, pdf_path: Path = None):
+        """Show the shared wipe-complete dialog (window-modal, no nested event loop)"""
+        self._cert_folder_path = folder_path
+        self._cert_pdf_path = pdf_path
+        self._cert_pdf_btn.setVisible(pdf_path is not None)
+        self._cert_msg.setInformativeText(details)
+        self._cert_msg.open()
+    
+    def _on_cert_dialog_clicked(self, button):
+        """Handle the action buttons of the wipe-complete certificate dialog"""
+        if button == self._cert_folder_btn:
+            self._open_certificate_folder(self._cert_folder_path)
+        elif button == self._cert_pdf_btn:
+            self._open_pdf_certificate(self._cert_pdf_path)
 
     def _show_wipe_complete_without_cert(self, wipe_result: Dict):
         """Show completion dialog without certificate"""
+        status = wipe_result.get('status', 'Unknown')
         if wipe_result.get('success'):
-            QMessageBox.information(
-                self,
+            method = wipe_result.get('method', 'Unknown')
+            duration = wipe_result.get('duration', 'N/A')
+            self._show(
+                QMessageBox.Information,
                 "✓ Wipe Complete",
                 f"Drive wiping completed successfully!\n\n"
-                f"Method: {wipe_result.get('method', 'Unknown')}\n"
-                f"Duration: {wipe_result.get('duration', 'N/A')}\n"
-                f"Status: {wipe_result.get('status', 'Unknown')}\n\n"
-                f"Note: Certificate generation was not available.",
-                QMessageBox.Ok
+                f"Method: {method}\n"
+                f"Duration: {duration}\n"
+                f"Status: {status}\n\n"
+                f"Note: Certificate generation was not available."
             )
         else:
-            QMessageBox.warning(
-                self,
+            self._show(
+                QMessageBox.Warning,
                 "Wipe Completed with Issues",
                 f"Wipe operation finished but may not be complete.\n\n"
-                f"Status: {wipe_result.get('status', 'Unknown')}\n"
-                f"Check the log for details.",
-                QMessageBox.Ok
+                f"Status: {status}\n"
+                f"Check the log for details."
             )
 
     def _open_certificate_folder(self, folder_path: Path):
         """Open the certificate folder in file explorer"""
         try:
-            import subprocess
-            import platform
-            
-            if platform.system() == 'Windows':
-                os.startfile(str(folder_path))
-            elif platform.system() == 'Darwin':  # macOS
-                subprocess.run(['open', str(folder_path)])
-            else:  # Linux
-                subprocess.run(['xdg-open', str(folder_path)])
+            open_with_system_viewer(folder_path)
                 
         except Exception as e:
             logger.error(f"Failed to open folder: {e}")
-            QMessageBox.warning(
-                self,
+            self._show(
+                QMessageBox.Warning,
                 "Error",
-                f"Could not open folder:\n{folder_path}",
-                QMessageBox.Ok
+                f"Could not open folder:\n{folder_path}"
             )
 
     def _open_pdf_certificate(self, pdf_path: Path):
         """Open the PDF certificate"""
         try:
-            import subprocess
-            import platform
-            
-            if not pdf_path.exists():
-                raise FileNotFoundError(f"PDF not found: {pdf_path}")
-            
-            if platform.system() == 'Windows':
-                os.startfile(str(pdf_path))
-            elif platform.system() == 'Darwin':  # macOS
-                subprocess.run(['open', str(pdf_path)])
-            else:  # Linux
-                subprocess.run(['xdg-open', str(pdf_path)])
+            # A missing file is reported by the opener itself (os.startfile
+            # raises; open/xdg-open exit non-zero, checked shortly after)
+            process = open_with_system_viewer(pdf_path)
+            if process is not None:
+                QTimer.singleShot(OPENER_CHECK_DELAY_MS,
+                                  lambda: self._check_pdf_opener(process, pdf_path))
                 
         except Exception as e:
-            logger.error(f"Failed to open PDF: {e}")
-            QMessageBox.warning(
-                self,
-                "Error",
-                f"Could not open PDF:\n{pdf_path}\n\nError: {str(e)}",
-                QMessageBox.Ok
-            )
+            self._pdf_open_failed(pdf_path, str(e))
+    
+    def _check_pdf_opener(self, process, pdf_path: Path):
+        """Report a PDF viewer launch that already exited with an error"""
+        returncode = process.poll()
+        if returncode:
+            self._pdf_open_failed(pdf_path, f"Viewer exited with code {returncode}")
+    
+    def _pdf_open_failed(self, pdf_path: Path, error: str):
+        """Warn that the PDF certificate could not be opened"""
+        logger.error(f"Failed to open PDF: {error}")
+        self._show(
+            QMessageBox.Warning,
+            "Error",
+            f"Could not open PDF:\n{pdf_path}\n\nError: {error}"
+        )
+    
+    def _cert_dir_has_files(self) -> bool:
+        """Whether the certificates folder has any certificate, rescanning only when its mtime changed"""
+        mtime = os.stat(self._cert_dir).st_mtime_ns
+        cached_mtime, has_certs = self._cert_dir_cache
+        if mtime != cached_mtime:
+            has_certs = has_certificate_files(self._cert_dir)
+            self._cert_dir_cache = (mtime, has_certs)
+        return has_certs
+    
     def view_certificates(self):
             """View local certificates"""
             try:
-                cert_dir = Path("certificates")
+                cert_dir = self._cert_dir
                 
-                if not cert_dir.exists():
-                    QMessageBox.information(
-                        self,
+                try:
+                    has_certs = self._cert_dir_has_files()
+                except FileNotFoundError:
+                    self._show(
+                        QMessageBox.Information,
                         "No Certificates",
                         "No certificates directory found.\n\n"
-                        "Certificates will be created after successful wipe operations.",
-                        QMessageBox.Ok
+                        "Certificates will be created after successful wipe operations."
                     )
                     return
                 
-                # Get all certificate files
-                json_certs = list(cert_dir.glob("*.json"))
-                txt_certs = list(cert_dir.glob("*.txt"))
-                all_certs = json_certs + txt_certs
-                
-                if not all_certs:
-                    QMessageBox.information(
-                        self,
+                if not has_certs:
+                    self._show(
+                        QMessageBox.Information,
                         "No Certificates",
                         "No certificates found.\n\n"
-                        "Certificates are generated after successful wipe operations.",
-                        QMessageBox.Ok
+                        "Certificates are generated after successful wipe operations."
                     )
                     return
                 
@@ -1339,49 +1194,44 @@ Note: Full certificate features require certificate_utils module.
                 
             except Exception as e:
                 logger.error(f"Error viewing certificates: {e}")
-                QMessageBox.critical(
-                    self,
+                self._show(
+                    QMessageBox.Critical,
                     "Error",
-                    f"Failed to view certificates:\n{str(e)}",
-                    QMessageBox.Ok
+                    f"Failed to view certificates:\n{str(e)}"
                 )
     
     def sync_certificates_to_cloud(self):
         """Sync local certificates to Supabase cloud"""
         if not self.certificate_manager:
-            QMessageBox.warning(
-                self,
+            self._show(
+                QMessageBox.Warning,
                 "Not Available",
-                "Certificate manager is not initialized.",
-                QMessageBox.Ok
+                "Certificate manager is not initialized."
             )
             return
         
         if not self.user:
-            QMessageBox.warning(
-                self,
+            self._show(
+                QMessageBox.Warning,
                 "Not Logged In",
                 "You must be logged in to sync certificates to the cloud.\n\n"
-                "Please restart the application and log in with your credentials.",
-                QMessageBox.Ok
+                "Please restart the application and log in with your credentials."
             )
             return
         
         # Confirm sync
-        reply = QMessageBox.question(
-            self,
+        confirmed = self._confirm(
+            QMessageBox.Question,
             "Sync Certificates",
             "Upload all local certificates to Supabase cloud?\n\n"
             "This will:\n"
             "• Upload all JSON and PDF files\n"
             "• Create database records\n"
             "• Skip certificates already uploaded\n\n"
-            "Continue?",
-            QMessageBox.Yes | QMessageBox.No,
-            QMessageBox.No
+            "Continue?"
         )
         
-        if reply != QMessageBox.Yes:
+        if not confirmed:
             return
         
         # Show progress
@@ -1401,22 +1251,20 @@ Note: Full certificate features require certificate_utils module.
             
             # Show results dialog
             if result['success']:
-                QMessageBox.information(
-                    self,
+                self._show(
+                    QMessageBox.Information,
                     "Sync Complete",
                     f"Certificate sync completed!\n\n"
                     f"Synced: {result['synced']}\n"
                     f"Skipped (already uploaded): {result['skipped']}\n"
                     f"Failed: {result['failed']}\n"
-                    f"Total processed: {result['total']}",
-                    QMessageBox.Ok
+                    f"Total processed: {result['total']}"
                 )
             else:
-                QMessageBox.warning(
-                    self,
+                self._show(
+                    QMessageBox.Warning,
                     "Sync Failed",
-                    f"Certificate sync failed:\n\n{result.get('message', 'Unknown error')}",
-                    QMessageBox.Ok
+                    f"Certificate sync failed:\n\n{result.get('message', 'Unknown error')}"
                 )
             
             self.status_label.setText("Ready")
@@ -1425,32 +1273,52 @@ Note: Full certificate features require certificate_utils module.
             logger.error(f"Sync error: {e}", exc_info=True)
             self.log(f"❌ Sync error: {str(e)}")
             self.status_label.setText("Sync failed")
-            QMessageBox.critical(
-                self,
+            self._show(
+                QMessageBox.Critical,
                 "Error",
-                f"An error occurred during sync:\n\n{str(e)}",
-                QMessageBox.Ok
+                f"An error occurred during sync:\n\n{str(e)}"
             )
 
     def logout(self):
         """Handle user logout"""
+        if self._logout_pending:
+            return
+        
         # Confirm logout
-        reply = QMessageBox.question(
-            self,
+        confirmed = self._confirm(
+            QMessageBox.Question,
             "Confirm Logout",
             "Are you sure you want to logout?\n\n"
-            "Any ongoing operations will be stopped.",
-            QMessageBox.Yes | QMessageBox.No,
-            QMessageBox.No
+            "Any ongoing operations will be stopped."
         )
 
-        if reply == QMessageBox.Yes:
+        if confirmed:
             self.log("User logged out")
+            self._logout_pending = True
+            self.logout_button.setEnabled(False)
 
             # Stop any ongoing wipe operation
             if self.wipe_thread and self.wipe_thread.isRunning():
                 self.wipe_thread.stop()
-                self.wipe_thread.wait()  # Wait for thread to finish
-
-            # Close the main window (this will return to login)
-            self.close()
+            
+            # Close once every worker has exited, without blocking the GUI thread
+            for thread in self._worker_threads():
+                if thread.isRunning():
+                    thread.finished.connect(self._close_when_idle, Qt.QueuedConnection)
+            self._close_when_idle()
+    
+    def _worker_threads(self):
+        """Worker threads that may still be running"""
+        return [thread for thread in (self.wipe_thread, self.drive_scan_thread, self.certificate_thread)
+                if thread is not None]
+    
+    def _close_when_idle(self):
+        """Close the main window (returning to login) once no worker thread is running"""
+        threads = self._worker_threads()
+        if any(thread.isRunning() for thread in threads):
+            return
+        
+        # finished is emitted just before a thread actually exits
+        for thread in threads:
+            thread.wait()
+        self.close()
@@ -0,0 +1,121 @@
+from PyQt5.QtGui import QFont, QPixmapCache, QBrush, QColor, QGradient, QLinearGradient, QPalette
+from functools import lru_cache
+from pathlib import Path
+import re
+
+# Theme stylesheets (<theme>.qss)
+RESOURCES_DIR = Path(__file__).parent / 'resources'
+
+_QSS_COMMENT_REGEX = re.compile(r"/\*.*?\*/", re.S)
+_QSS_SPACE_REGEX = re.compile(r"\s*([{};:,])\s*|\s+")
+_QSS_RULE_REGEX = re.compile(r"([^{}]+)\{([^{}]*)\}")
+
+# Themes selectable through the main window's "theme" property (first is the default)
+THEMES = ("dark", "light")
+# Tooltips are top-level windows, not main window descendants, so they can't be
+# scoped; each theme's tooltip rules are installed application-wide instead
+_UNSCOPED_SELECTORS = frozenset({"QToolTip"})
+
+# Standard icons by (style key, QStyle.StandardPixmap value)
+_ICON_CACHE = {}
+
+
+@lru_cache(maxsize=None)
+def theme_stylesheet(theme: str) -> str:
+    """Get a theme's QSS (compacted), read from disk only on first use"""
+    return compact_qss((RESOURCES_DIR / f"{theme}.qss").read_text(encoding='utf-8'))
+
+
+@lru_cache(maxsize=None)
+def combined_theme_stylesheet() -> str:
+    """Get one QSS holding every theme, each rule scoped to QMainWindow[theme="<name>"]
+
+    Installed once on the main window; switching themes is then a property change
+    and a repolish rather than a reparse of the whole sheet.
+    """
+    rules = []
+    for theme in THEMES:
+        scope = f'QMainWindow[theme="{theme}"]'
+        for selectors, body in _QSS_RULE_REGEX.findall(theme_stylesheet(theme)):
+            if selectors in _UNSCOPED_SELECTORS:
+                continue
+            scoped = ",".join(
+                scope + selector[len("QMainWindow"):] if selector.startswith("QMainWindow")
+                else f"{scope} {selector}"
+                for selector in selectors.split(",")
+            )
+            rules.append(f"{scoped}{{{body}}}")
+    return "".join(rules)
+
+
+@lru_cache(maxsize=None)
+def unscoped_theme_stylesheet(theme: str) -> str:
+    """Get a theme's rules left out of combined_theme_stylesheet (for QApplication)"""
+    return "".join(
+        f"{selectors}{{{body}}}"
+        for selectors, body in _QSS_RULE_REGEX.findall(theme_stylesheet(theme))
+        if selectors in _UNSCOPED_SELECTORS
+    )
+
+
+def compact_qss(qss: str) -> str:
+    """Strip comments and insignificant whitespace from a stylesheet"""
+    qss = _QSS_COMMENT_REGEX.sub("", qss)
+    return _QSS_SPACE_REGEX.sub(lambda m: m.group(1) or " ", qss).strip()
+
+
+@lru_cache(maxsize=None)
+def ui_font(size: int, bold: bool = False) -> QFont:
+    """Get a shared Segoe UI font (built on first use, once a QApplication exists)"""
+    return QFont("Segoe UI", size, QFont.Bold) if bold else QFont("Segoe UI", size)
+
+
+@lru_cache(maxsize=None)
+def mono_font(size: int) -> QFont:
+    """Get a shared monospace font for console-style text"""
+    font = QFont("Consolas", size)
+    font.setStyleHint(QFont.Monospace)
+    return font
+
+
+def _style_key(style) -> str:
+    """Identify a style, so icons from different styles are cached apart"""
+    return f"{style.metaObject().className()}:{style.objectName()}"
+
+
+def cached_standard_icon(style, standard_pixmap):
+    """Get a standard icon, looking it up from the style only on first use"""
+    key = (_style_key(style), standard_pixmap)
+    icon = _ICON_CACHE.get(key)
+    if icon is None:
+        icon = style.standardIcon(standard_pixmap)
+        _ICON_CACHE[key] = icon
+    return icon
+
+
+def cached_standard_pixmap(style, standard_pixmap, size: int):
+    """Get a standard icon pixmap, rasterizing it only on first use"""
+    key = f"zt:icon:{_style_key(style)}:{int(standard_pixmap)}:{size}"
+    pixmap = QPixmapCache.find(key)
+    if pixmap is None or pixmap.isNull():
+        pixmap = style.standardIcon(standard_pixmap).pixmap(size, size)
+        QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+
+@lru_cache(maxsize=None)
+def vertical_gradient_brush(top: str, bottom: str) -> QBrush:
+    """Get a shared top-to-bottom gradient brush that stretches to the painted widget"""
+    gradient = QLinearGradient(0, 0, 0, 1)
+    gradient.setCoordinateMode(QGradient.StretchToDeviceMode)
+    gradient.setColorAt(0, QColor(top))
+    gradient.setColorAt(1, QColor(bottom))
+    return QBrush(gradient)
+
+
+def apply_window_brush(widget, brush: QBrush):
+    """Paint a widget's window background from its palette instead of a QSS rule"""
+    palette = widget.palette()
+    palette.setBrush(QPalette.Window, brush)
+    widget.setPalette(palette)
+    widget.setAutoFillBackground(True)
@@ -198,6 +198,7 @@ class DeviceInfo:
         self.serial = serial
         self.model = model
         self.size_gb = size / (1024 ** 3) if size > 0 else 0
+        self.size_display = f"{self.size_gb:.2f} GB"
         
         # Extended properties
         self.drive_type = DriveType.UNKNOWN
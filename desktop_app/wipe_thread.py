@@ -1,7 +1,23 @@
 from PyQt5.QtCore import QThread, pyqtSignal
 from wipe_engine import WipeEngine
+from logger import logger
+import pythoncom
+import re
+import time
+
+# Minimum seconds between progress signals within the same phase (<= 10/sec)
+PROGRESS_EMIT_INTERVAL = 0.1
+
+_DIGITS_REGEX = re.compile(r"\d+")
+
+def progress_phase(message: str) -> str:
+    """Progress message with its numbers stripped, identifying the wipe phase"""
+    return _DIGITS_REGEX.sub("", message)
 
 class WipeThread(QThread):
+    """Run a wipe off the GUI thread; the GUI only receives queued signals"""
+    # Emitted at most every PROGRESS_EMIT_INTERVAL, except on phase changes
+    # (a phase's last throttled update is still delivered before the next phase)
     progress_updated = pyqtSignal(int, str)
     wipe_completed = pyqtSignal(dict) 
     wipe_failed = pyqtSignal(str)
@@ -13,10 +29,33 @@ class WipeThread(QThread):
         self.confirm = confirm
         self.wipe_engine = WipeEngine()
         self._stop_requested = False
+        self._last_emit = 0.0
+        self._last_phase = None
+        # Latest (progress, message) held back by the throttle
+        self._pending_progress = None
+
+    def _flush_pending_progress(self):
+        """Emit the last throttled progress update, if any"""
+        if self._pending_progress is not None:
+            self.progress_updated.emit(*self._pending_progress)
+            self._pending_progress = None
 
     def run(self):
+        # Filesystem detection before the wipe queries WMI from this thread
+        pythoncom.CoInitialize()
         try:
             def progress_callback(progress, message):
+                now = time.monotonic()
+                phase = progress_phase(message)
+                if phase != self._last_phase:
+                    # Let the previous phase end on its final value (e.g. 100% of a pass)
+                    self._flush_pending_progress()
+                elif now - self._last_emit < PROGRESS_EMIT_INTERVAL:
+                    self._pending_progress = (progress, message)
+                    return
+                self._pending_progress = None
+                self._last_emit = now
+                self._last_phase = phase
                 self.progress_updated.emit(progress, message)
 
             # Start the wipe operation
@@ -25,6 +64,7 @@ class WipeThread(QThread):
                 self.method, 
                 progress_callback
             )
+            self._flush_pending_progress()
 
             # Check if wipe was successful
             if result.get('success') or result.get('status') in ['Completed', 'Cancelled']:
@@ -35,7 +75,74 @@ class WipeThread(QThread):
 
         except Exception as e:
             self.wipe_failed.emit(str(e))
+        finally:
+            pythoncom.CoUninitialize()
 
     def stop(self):
         self._stop_requested = True
-        self.wipe_engine.stop_wipe()
\ No newline at end of file
+        self.wipe_engine.stop_wipe()
+
+
+class DriveScanThread(QThread):
+    """Enumerate available drives without blocking the GUI thread"""
+    drives_ready = pyqtSignal(list)
+
+    def run(self):
+        drives = []
+        # WMI is COM-based: this thread needs its own apartment and connection
+        pythoncom.CoInitialize()
+        try:
+            drives = WipeEngine().get_available_drives()
+        except Exception as e:
+            logger.error("Drive scan failed: %s", e, exc_info=True)
+        finally:
+            pythoncom.CoUninitialize()
+
+        self.drives_ready.emit(drives)
+
+
+class CertificateThread(QThread):
+    """Generate, sign and optionally upload a certificate without blocking the GUI thread"""
+    log_message = pyqtSignal(str)
+    # json_path, pdf_path, cert_data, uploaded
+    certificate_ready = pyqtSignal(object, object, dict, bool)
+    certificate_failed = pyqtSignal(str)
+
+    def __init__(self, certificate_manager, cert_wipe_data, upload):
+        super().__init__()
+        self.certificate_manager = certificate_manager
+        self.cert_wipe_data = cert_wipe_data
+        self.upload = upload
+
+    def run(self):
+        try:
+            json_path, pdf_path, cert_data = self.certificate_manager.generate_and_sign_certificate(
+                self.cert_wipe_data
+            )
+        except Exception as e:
+            logger.error("Certificate generation failed: %s", e, exc_info=True)
+            self.certificate_failed.emit(str(e))
+            return
+
+        self.log_message.emit(f"✓ Certificate generated: {cert_data['cert_id']}")
+        self.log_message.emit(f"  JSON: {json_path}")
+        self.log_message.emit(f"  PDF: {pdf_path}")
+
+        # Try to upload certificate if user is logged in
+        uploaded = False
+        if self.upload:
+            self.log_message.emit("Uploading certificate to cloud...")
+            try:
+                uploaded = self.certificate_manager.upload_certificate(json_path, pdf_path, cert_data)
+
+                if uploaded:
+                    self.log_message.emit("✓ Certificate uploaded successfully")
+                else:
+                    self.log_message.emit("⚠️ Certificate upload failed - saved locally")
+            except Exception as upload_err:
+                self.log_message.emit(f"⚠️ Upload error: {upload_err}")
+                uploaded = False
+        else:
+            self.log_message.emit("ℹ️ Not logged in - certificate saved locally only")
+
+        self.certificate_ready.emit(json_path, pdf_path, cert_data, uploaded)